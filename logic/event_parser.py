@@ -4,16 +4,32 @@ This module contains classes for extracting timestamps and other data from log l
 """
 import re
 
+# Patterns are compiled once at import; the parsers run them on every log line
+_EPDC_MARKER_RE = re.compile(r'EPDC\]\[(\d+)\]')
+_FB_MARKER_RE = re.compile(r'mxc_epdc_fb: \[(\d+)\]')
+_HEIGHT_RE = re.compile(r'height=(\d+)')
+_WIDTH_HEIGHT_RE = re.compile(r'width=\d+, height=(\d+)')
+_WAVEFORM_RES = [re.compile(pattern) for pattern in (
+    r'new waveform = (?:0x)?[\da-f]+ \(([\w_() ]+)\)',
+    r'waveform:(?:0x)?[\da-f]+ \(([\w_() ]+)\)',
+    r'waveform=(?:0x)?[\da-f]+ \(([\w_() ]+)\)',
+    r'Sending update\. waveform:(?:0x)?[\da-f]+ \(([\w_() ]+)\)'
+)]
+_END_TIME_RE = re.compile(r'end time=(\d+)')
+_BUTTON_UP_RE = re.compile(r'button 1 up (\d+\.\d+)')
+_BUTTON_DOWN_RE = re.compile(r'Sending button 1 down (\d+\.\d+)')
+_POWER_BUTTON_RE = re.compile(r'def:pbpress:time=(\d+\.\d+):Power button pressed')
+
 class BaseEventParser:
     """Base class for parsing log events with common extraction methods"""
 
     def extract_marker(self, line):
         """Extract marker number from log line"""
-        match1 = re.search(r'EPDC\]\[(\d+)\]', line)
+        match1 = _EPDC_MARKER_RE.search(line)
         if match1:
             return match1.group(1)
 
-        match2 = re.search(r'mxc_epdc_fb: \[(\d+)\]', line)
+        match2 = _FB_MARKER_RE.search(line)
         if match2:
             return match2.group(1)
 
@@ -21,20 +37,13 @@ class BaseEventParser:
 
     def extract_height_and_waveform(self, line):
         """Extract height and waveform information from log line"""
-        height_match = re.search(r'height=(\d+)', line)
+        height_match = _HEIGHT_RE.search(line)
         if not height_match:
-            height_match = re.search(r'width=\d+, height=(\d+)', line)
-
-        waveform_patterns = [
-            r'new waveform = (?:0x)?[\da-f]+ \(([\w_() ]+)\)',
-            r'waveform:(?:0x)?[\da-f]+ \(([\w_() ]+)\)',
-            r'waveform=(?:0x)?[\da-f]+ \(([\w_() ]+)\)',
-            r'Sending update\. waveform:(?:0x)?[\da-f]+ \(([\w_() ]+)\)'
-        ]
+            height_match = _WIDTH_HEIGHT_RE.search(line)
 
         waveform_name = None
-        for pattern in waveform_patterns:
-            match = re.search(pattern, line)
+        for pattern in _WAVEFORM_RES:
+            match = pattern.search(line)
             if match:
                 waveform_name = match.group(1).strip()
                 break
@@ -49,7 +58,7 @@ class BaseEventParser:
 
     def extract_end_timestamp(self, line):
         """Extract end timestamp from log line"""
-        match = re.search(r'end time=(\d+)', line)
+        match = _END_TIME_RE.search(line)
         if match:
             timestamp_str = match.group(1)
             last_6 = timestamp_str[-6:]
@@ -65,7 +74,7 @@ class DefaultEventParser(BaseEventParser):
 
     def extract_start_timestamp(self, line):
         """Extract start timestamp from "button 1 up" event"""
-        match = re.search(r'button 1 up (\d+\.\d+)', line)
+        match = _BUTTON_UP_RE.search(line)
         if match:
             timestamp_str = match.group(1)
             parts = timestamp_str.split('.')
@@ -81,7 +90,7 @@ class SwipeEventParser(BaseEventParser):
 
     def extract_start_timestamp(self, line):
         """Extract start timestamp from "Sending button 1 down" event"""
-        match = re.search(r'Sending button 1 down (\d+\.\d+)', line)
+        match = _BUTTON_DOWN_RE.search(line)
         if match:
             timestamp_str = match.group(1)
             parts = timestamp_str.split('.')
@@ -97,7 +106,7 @@ class SuspendEventParser(BaseEventParser):
 
     def extract_start_timestamp(self, line):
         """Extract start timestamp from power button press event"""
-        match = re.search(r'def:pbpress:time=(\d+\.\d+):Power button pressed', line)
+        match = _POWER_BUTTON_RE.search(line)
         if match:
             timestamp_str = match.group(1)
             parts = timestamp_str.split('.')
@@ -1,6 +1,27 @@
+import io
+import os
 import re
+import zipfile
 from PyQt5.QtCore import QThread, pyqtSignal
 from logic.event_parser import DefaultEventParser, SwipeEventParser, SuspendEventParser
+from logic.result_cache import cache_key, load_cached_result, store_cached_result
+
+# Compiled once at import and shared by every caller
+_ITERATION_RE = re.compile(r'ITERATION_(\d+)')
+_END_MARKER_RE = re.compile(r'update end marker=(\d+)')
+
+_WAVEFORM_LINE_FORMAT = "{0}. Height - {1}, Waveform - {2}".format
+
+# Parsers hold no state, so one instance per mode is shared by every iteration
+_PARSERS = {
+    "suspend": SuspendEventParser(),
+    "swipe": SwipeEventParser(),
+    "default": DefaultEventParser()
+}
+
+# Archive members picked up from .zip batch inputs
+LOG_FILE_EXTENSIONS = ('.log', '.txt')
+
 
 class LogProcessor(QThread):
     """Enhanced log processor with original log storage"""
@@ -17,139 +38,263 @@ class LogProcessor(QThread):
 
     def run(self):
         try:
-            self.progress_updated.emit(10)
+            data = parse_log_content(self.log_content, self.mode, self.progress_updated.emit)
+            self.results_data = data['results'] # Store for synchronous access
+            self.result_ready.emit(data)
 
-            iterations = re.split(r'ITERATION_(\d+)', self.log_content)[1:]
-            if not iterations:
-                iterations = ["01", self.log_content]
+        except Exception as e:
+            self.error_occurred.emit(str(e))
 
-            self.progress_updated.emit(30)
+        finally:
+            # The joined log text is not needed once parsed; don't keep it pinned
+            # for as long as the caller holds on to this thread object
+            self.log_content = ""
 
-            iteration_pairs = []
-            for i in range(0, len(iterations), 2):
-                if i + 1 < len(iterations):
-                    iteration_num = iterations[i]
-                    iteration_content = iterations[i+1]
-                    iteration_pairs.append((iteration_num, iteration_content))
+    def process_iteration(self, lines, iteration_num, mode="default"):
+        """Process a single iteration with the correct suspend parsing"""
+        return process_iteration(lines, iteration_num, mode)
 
-            self.progress_updated.emit(50)
 
-            results = []
-            total_iterations = len(iteration_pairs)
+def format_waveform_lines(result):
+    """Return the numbered "Height - h, Waveform - w" lines for a result.
 
-            for idx, (iteration_num, iteration_content) in enumerate(iteration_pairs):
-                lines = iteration_content.split('\n')
-                result = self.process_iteration(lines, iteration_num, self.mode)
+    The joined text is cached on the result dict under 'waveform_text'.
+    """
+    text = result.get('waveform_text')
+    if text is None:
+        heights = result.get('heights')
+        waveforms = result.get('waveforms')
+        if heights is None or waveforms is None:
+            # Results restored from older sessions only carry all_heights
+            heights = [h['height'] for h in result['all_heights']]
+            waveforms = [h['waveform'] for h in result['all_heights']]
+        text = "\n".join(map(_WAVEFORM_LINE_FORMAT, range(1, len(heights) + 1), heights, waveforms))
+        result['waveform_text'] = text
+    return text
 
-                if result:
-                    result['original_log'] = iteration_content.strip()
-                    results.append(result)
 
-                progress = 50 + (idx + 1) * 40 // (total_iterations or 1)
-                self.progress_updated.emit(progress)
+def format_duration(result):
+    """Return the result's duration as display text with three decimals.
 
-            self.results_data = results # Store for synchronous access
-            self.progress_updated.emit(100)
-            self.result_ready.emit({'results': results, 'total_iterations': len(iteration_pairs)})
+    The text is cached on the result dict under 'duration_text'.
+    """
+    text = result.get('duration_text')
+    if text is None:
+        text = result['duration_text'] = f"{result['duration']:.3f}"
+    return text
 
-        except Exception as e:
-            self.error_occurred.emit(str(e))
 
-    def process_iteration(self, lines, iteration_num, mode="default"):
-        """Process a single iteration with the correct suspend parsing"""
-        
-        parser_map = {
-            "suspend": SuspendEventParser(),
-            "swipe": SwipeEventParser(),
-            "default": DefaultEventParser()
-        }
-        parser = parser_map.get(mode, DefaultEventParser())
-
-        start_time = None
-        start_line = None
-        end_times_by_marker = {}
-        heights_by_marker = {}
-        current_marker = None
-
-        for line in lines:
-            if not line.strip():
-                continue
-
-            if not start_time:
-                possible_start = parser.extract_start_timestamp(line)
-                if possible_start:
-                    start_time = possible_start
-                    start_line = line.strip()
-
-            marker = parser.extract_marker(line)
-            if marker:
-                current_marker = marker
-
-            if "Sending update" in line and current_marker:
-                height_waveform = parser.extract_height_and_waveform(line)
-                if height_waveform:
-                    heights_by_marker[current_marker] = {
-                        'height': height_waveform['height'],
-                        'waveform': height_waveform.get('waveform', "unknown") or "unknown",
+def list_batch_sources(file_path):
+    """Return (display_name, member, size) tuples to parse for a batch input path.
+
+    Plain log files give a single entry with member None; zip archives give
+    one entry per log member, read later straight from the archive. size is
+    the uncompressed byte count, used to schedule the largest inputs first.
+    """
+    filename = os.path.basename(file_path)
+    if not file_path.lower().endswith('.zip'):
+        return [(filename, None, os.path.getsize(file_path))]
+
+    with zipfile.ZipFile(file_path) as zf:
+        return [(f"{filename}/{info.filename}", info.filename, info.file_size)
+                for info in zf.infolist()
+                if not info.is_dir() and info.filename.lower().endswith(LOG_FILE_EXTENSIONS)]
+
+
+def report_base_names(display_names):
+    """Map batch display names to distinct file name stems for their reports.
+
+    Archive members keep their path, flattened with underscores
+    (z.zip/a/f0.log -> z.zip_a_f0), so they never share a report name with a
+    plain f0.log. Any names that still clash, ignoring case, get a numeric suffix.
+    """
+    bases = {}
+    used = set()
+    for name in display_names:
+        base = os.path.splitext(name)[0].replace('/', '_')
+        candidate = base
+        suffix = 2
+        while candidate.lower() in used:
+            candidate = f"{base}_{suffix}"
+            suffix += 1
+        used.add(candidate.lower())
+        bases[name] = candidate
+    return bases
+
+
+def process_log_file(file_path, mode="default", member=None, use_cache=True):
+    """Read and parse a log file, or one member of a zip archive.
+
+    Archive members are decompressed in memory and never extracted to disk.
+    With use_cache, results for unchanged content are served from the disk cache.
+    Module-level and Qt-free so it can be submitted to a process pool.
+    """
+    if member is not None:
+        with zipfile.ZipFile(file_path) as zf:
+            raw_bytes = zf.read(member)
+    else:
+        with open(file_path, 'rb') as f:
+            if hasattr(os, 'posix_fadvise'):
+                # The whole file is read front to back; let the kernel read ahead aggressively
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            raw_bytes = f.read()
+
+    key = cache_key(raw_bytes, mode) if use_cache else None
+    if key:
+        cached = load_cached_result(key)
+        if cached is not None:
+            return cached
+
+    # Decode like text-mode open(): ignore bad bytes, normalise newlines
+    content = io.TextIOWrapper(io.BytesIO(raw_bytes), encoding='utf-8', errors='ignore').read()
+    data = parse_log_content(content, mode)
+    if key:
+        store_cached_result(key, data)
+    return data
+
+
+def parse_log_content(log_content, mode="default", progress=None):
+    """Split log text into iterations and process each one.
+
+    progress, if given, is called with a percentage as work advances.
+    Returns a dict with 'results' and 'total_iterations'.
+    """
+    if progress is None:
+        progress = lambda value: None
+
+    progress(10)
+
+    iterations = []
+    if 'ITERATION_' in log_content:
+        iterations = _ITERATION_RE.split(log_content)[1:]
+    if not iterations:
+        iterations = ["01", log_content]
+
+    progress(30)
+
+    iteration_pairs = []
+    for i in range(0, len(iterations), 2):
+        if i + 1 < len(iterations):
+            iteration_num = iterations[i]
+            iteration_content = iterations[i+1]
+            iteration_pairs.append((iteration_num, iteration_content))
+
+    progress(50)
+
+    results = []
+    total_iterations = len(iteration_pairs)
+    # Only report when the percentage moves; each report is a queued signal to the GUI
+    last_percent = 50
+
+    for idx, (iteration_num, iteration_content) in enumerate(iteration_pairs):
+        lines = iteration_content.split('\n')
+        result = process_iteration(lines, iteration_num, mode)
+
+        if result:
+            result['original_log'] = iteration_content.strip()
+            results.append(result)
+
+        percent = 50 + (idx + 1) * 40 // (total_iterations or 1)
+        if percent != last_percent:
+            progress(percent)
+            last_percent = percent
+
+    progress(100)
+    return {'results': results, 'total_iterations': len(iteration_pairs)}
+
+
+def process_iteration(lines, iteration_num, mode="default"):
+    """Process a single iteration with the correct suspend parsing"""
+    parser = _PARSERS.get(mode, _PARSERS["default"])
+
+    start_time = None
+    start_line = None
+    end_times_by_marker = {}
+    heights_by_marker = {}
+    current_marker = None
+
+    for line in lines:
+        if not line.strip():
+            continue
+
+        if not start_time:
+            possible_start = parser.extract_start_timestamp(line)
+            if possible_start:
+                start_time = possible_start
+                start_line = line.strip()
+
+        marker = parser.extract_marker(line)
+        if marker:
+            current_marker = marker
+
+        if "Sending update" in line and current_marker:
+            height_waveform = parser.extract_height_and_waveform(line)
+            if height_waveform:
+                heights_by_marker[current_marker] = {
+                    'height': height_waveform['height'],
+                    'waveform': height_waveform.get('waveform', "unknown") or "unknown",
+                    'line': line.strip()
+                }
+
+        if "update end marker=" in line and "end time=" in line:
+            end_marker_match = _END_MARKER_RE.search(line)
+            if end_marker_match:
+                end_marker = end_marker_match.group(1)
+                end_time = parser.extract_end_timestamp(line)
+                if end_time:
+                    end_times_by_marker[end_marker] = {
+                        'time': end_time,
                         'line': line.strip()
                     }
 
-            if "update end marker=" in line and "end time=" in line:
-                end_marker_match = re.search(r'update end marker=(\d+)', line)
-                if end_marker_match:
-                    end_marker = end_marker_match.group(1)
-                    end_time = parser.extract_end_timestamp(line)
-                    if end_time:
-                        end_times_by_marker[end_marker] = {
-                            'time': end_time,
-                            'line': line.strip()
-                        }
-
-        if not start_time or not heights_by_marker or not end_times_by_marker:
-            return None
+    if not start_time or not heights_by_marker or not end_times_by_marker:
+        return None
 
-        valid_heights = {m: i for m, i in heights_by_marker.items() if i['waveform'].lower() != "unknown"}
-        if not valid_heights:
-            valid_heights = heights_by_marker
-        if not valid_heights:
-            return None
+    valid_heights = {m: i for m, i in heights_by_marker.items() if i['waveform'].lower() != "unknown"}
+    if not valid_heights:
+        valid_heights = heights_by_marker
+    if not valid_heights:
+        return None
 
-        max_height = max(info['height'] for info in valid_heights.values())
-        max_height_markers = [m for m, i in valid_heights.items() if i['height'] == max_height]
-        max_height_markers.sort(key=lambda m: int(m) if m.isdigit() else 0)
-        chosen_marker = max_height_markers[-1] if max_height_markers else list(valid_heights.keys())[0]
-        max_height_info = valid_heights[chosen_marker]
+    max_height = max(info['height'] for info in valid_heights.values())
+    max_height_markers = [m for m, i in valid_heights.items() if i['height'] == max_height]
+    max_height_markers.sort(key=lambda m: int(m) if m.isdigit() else 0)
+    chosen_marker = max_height_markers[-1] if max_height_markers else list(valid_heights.keys())[0]
+    max_height_info = valid_heights[chosen_marker]
 
-        if chosen_marker in end_times_by_marker:
-            max_height_end_time = end_times_by_marker[chosen_marker]['time']
-            stop_line = end_times_by_marker[chosen_marker]['line']
+    if chosen_marker in end_times_by_marker:
+        max_height_end_time = end_times_by_marker[chosen_marker]['time']
+        stop_line = end_times_by_marker[chosen_marker]['line']
+    else:
+        if end_times_by_marker:
+            max_end_time_marker = max(end_times_by_marker, key=lambda m: end_times_by_marker[m]['time'])
+            max_height_end_time = end_times_by_marker[max_end_time_marker]['time']
+            stop_line = end_times_by_marker[max_end_time_marker]['line']
         else:
-            if end_times_by_marker:
-                max_end_time_marker = max(end_times_by_marker, key=lambda m: end_times_by_marker[m]['time'])
-                max_height_end_time = end_times_by_marker[max_end_time_marker]['time']
-                stop_line = end_times_by_marker[max_end_time_marker]['line']
-            else:
-                return None
-
-        # *** BUG FIX: Reverted to original duration calculation ***
-        duration = max_height_end_time - start_time
-        if duration < 0:
-            duration = abs(duration)
-
-        duration_sec = duration / 1000.0
-
-        return {
-            'iteration': int(iteration_num),
-            'start': start_time,
-            'stop': max_height_end_time,
-            'marker': chosen_marker,
-            'duration': duration_sec,
-            'max_height': max_height_info['height'],
-            'max_height_waveform': max_height_info['waveform'],
-            'start_line': start_line,
-            'stop_line': stop_line,
-            'height_line': max_height_info['line'],
-            'all_heights': [{'marker': m, 'height': h['height'], 'waveform': h['waveform']} for m, h in heights_by_marker.items()],
-            'mode': mode,
-            'all_end_times': end_times_by_marker
-        }
+            return None
+
+    # *** BUG FIX: Reverted to original duration calculation ***
+    duration = max_height_end_time - start_time
+    if duration < 0:
+        duration = abs(duration)
+
+    duration_sec = duration / 1000.0
+
+    return {
+        'iteration': int(iteration_num),
+        'start': start_time,
+        'stop': max_height_end_time,
+        'marker': chosen_marker,
+        'duration': duration_sec,
+        'max_height': max_height_info['height'],
+        'max_height_waveform': max_height_info['waveform'],
+        'start_line': start_line,
+        'stop_line': stop_line,
+        'height_line': max_height_info['line'],
+        'all_heights': [{'marker': m, 'height': h['height'], 'waveform': h['waveform']} for m, h in heights_by_marker.items()],
+        # Same data as all_heights, as parallel lists for fast formatting
+        'heights': [h['height'] for h in heights_by_marker.values()],
+        'waveforms': [h['waveform'] for h in heights_by_marker.values()],
+        'mode': mode,
+        'all_end_times': end_times_by_marker
+    }
@@ -0,0 +1,106 @@
+"""
+result_cache.py - On-disk cache of parsed log results
+Results are keyed by a hash of the raw log bytes and the calculation mode,
+so re-processing an unchanged file skips parsing entirely.
+"""
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".kindle_log_analyzer_cache")
+
+# Bump when the shape of parsed results changes so stale entries are ignored
+CACHE_VERSION = 1
+
+# Least recently used entries are pruned once the cache grows past this
+CACHE_MAX_BYTES = 256 << 20
+
+
+def cache_key(raw_bytes, mode):
+    """Build the cache key for raw log bytes parsed in the given mode"""
+    digest = hashlib.blake2b(raw_bytes, digest_size=16).hexdigest()
+    return f"v{CACHE_VERSION}_{digest}_{mode}"
+
+
+def load_cached_result(key, cache_dir=CACHE_DIR):
+    """Return the cached parse result for key, or None if absent or unreadable"""
+    path = os.path.join(cache_dir, key + ".pkl")
+    try:
+        with open(path, 'rb') as f:
+            data = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Corrupt, truncated, or pickled against code that no longer exists:
+        # drop the entry so the file is reparsed and the entry rewritten
+        _remove(path)
+        return None
+    try:
+        # Mark the entry as recently used so pruning removes it last
+        os.utime(path)
+    except OSError:
+        pass
+    return data
+
+
+def store_cached_result(key, data, cache_dir=CACHE_DIR):
+    """Write a parse result to the cache, then prune it; failures are ignored"""
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temp file first so concurrent workers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, os.path.join(cache_dir, key + ".pkl"))
+    except Exception:
+        _remove(tmp_path)
+        return
+    prune_cache(cache_dir)
+
+
+def prune_cache(cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+    """Delete the least recently used entries until the cache fits in max_bytes"""
+    entries = []
+    total = 0
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".pkl"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+    except OSError:
+        return
+    if total <= max_bytes:
+        return
+    entries.sort()
+    for _mtime, size, path in entries:
+        if total <= max_bytes:
+            break
+        if _remove(path):
+            total -= size
+
+
+def _remove(path):
+    """Delete a cache file; True if it is gone"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return False
+    return True
+
+
+def clear_cache(cache_dir=CACHE_DIR):
+    """Delete every cached result"""
+    shutil.rmtree(cache_dir, ignore_errors=True)
@@ -6,12 +6,24 @@ class StateManager:
         self.batch_results = {}
         self.loaded_files = []
         self.current_iteration = 1
-        self.all_iterations_data = ""
+        self._iteration_chunks = []
         self.test_case_title = ""
         self.current_mode = "default"
         self.dark_mode = False
         self.processed_test_cases = set()
-        self.threads = []
+
+    @property
+    def all_iterations_data(self):
+        """Accumulated iteration log text, joined on demand."""
+        return "".join(self._iteration_chunks)
+
+    @all_iterations_data.setter
+    def all_iterations_data(self, value):
+        self._iteration_chunks = [value] if value else []
+
+    def append_iteration_data(self, *chunks):
+        """Append text to the iteration log without re-copying what is already stored."""
+        self._iteration_chunks.extend(chunks)
 
     def to_dict(self):
         """Convert state to a serializable dictionary."""
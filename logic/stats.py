@@ -0,0 +1,16 @@
+"""
+stats.py - Summary statistics over parsed iteration results
+"""
+import numpy as np
+
+
+def duration_stats(results):
+    """Return (mean, min, max, durations) for a list of iteration results.
+
+    durations is a float64 array in iteration order; callers format from it
+    instead of walking the result dicts again.
+    """
+    durations = np.fromiter((r['duration'] for r in results), dtype=np.float64, count=len(results))
+    if not len(durations):
+        return 0.0, 0.0, 0.0, durations
+    return float(durations.mean()), float(durations.min()), float(durations.max()), durations
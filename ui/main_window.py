@@ -7,6 +7,11 @@ import difflib
 from datetime import datetime
 from pathlib import Path
 import zipfile
+from contextlib import contextmanager
+from functools import lru_cache
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QTextEdit, QPushButton, QLabel,
@@ -14,20 +19,81 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QSplitter, QGroupBox, QFileDialog, QProgressBar,
                              QLineEdit, QComboBox, QListWidget, QMessageBox,
                              QHeaderView, QAbstractItemView, QCheckBox, QGridLayout,
-                             QFrame, QScrollArea)
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QColor, QBrush
+                             QScrollArea, QPlainTextEdit, QTableView)
+from PyQt5.QtCore import Qt, QMimeData, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt5.QtGui import QFontDatabase
 
-from logic.log_processor import LogProcessor
+from logic.log_processor import LogProcessor, format_duration, format_waveform_lines, list_batch_sources, process_log_file, report_base_names
 from logic.state_manager import StateManager
+from logic.result_cache import clear_cache
+from logic.stats import duration_stats
+from ui.table_models import HEADER_BRUSH, HEADER_FONT, ResultsTableModel, HeightsTableModel
 from utils.pdf_export import PdfExporter
 from utils.txt_export import TxtExporter
 from utils.excel_export import ExcelExporter
-import openpyxl
-from openpyxl.styles import Font, Alignment, PatternFill
+
+
+_UI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@lru_cache(maxsize=None)
+def _load_stylesheet(name):
+    """Read a .qss theme file next to this module once per process"""
+    with open(os.path.join(_UI_DIR, name), 'r') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=4096)
+def _iteration_header(iteration):
+    """Header line separating pasted iterations in the accumulated log"""
+    return f"\nITERATION_{iteration:02d}\n"
+
+
+class _ExportSignals(QObject):
+    """Signals used by _ExportJob to report back to the GUI thread"""
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class _ExportJob(QRunnable):
+    """Runs an export callable on a pool thread"""
+
+    def __init__(self, func, parent):
+        super().__init__()
+        self.func = func
+        # Parented to the window so it outlives the runnable until its signals are delivered
+        self.signals = _ExportSignals(parent)
+
+    def run(self):
+        try:
+            result = self.func()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
 
 
 class FinalKindleLogAnalyzer(QMainWindow):
+    # Emitted from process-pool callbacks; delivered on the GUI thread.
+    # The trailing int is the batch generation the file was submitted under.
+    batch_file_processed = pyqtSignal(dict, str, int)
+    batch_file_failed = pyqtSignal(str, str, int)
+
+    # Tables larger than this skip resize-to-contents on refresh
+    RESIZE_TO_CONTENTS_MAX_ROWS = 200
+
+    # Upper bound on worker processes used for batch parsing
+    MAX_BATCH_WORKERS = 8
+
+    # Cap on lines kept in the batch results view
+    BATCH_TEXT_MAX_BLOCKS = 100000
+
+    # Delay used to coalesce back-to-back tab invalidations
+    TAB_REFRESH_DELAY_MS = 50
+
+    # Calculation modes, in calc_mode_combo order
+    _MODES = ("default", "swipe", "suspend")
+
     def __init__(self):
         super().__init__()
         self.state = StateManager()
@@ -37,6 +103,23 @@ class FinalKindleLogAnalyzer(QMainWindow):
         logging.basicConfig(filename='kindle_log_analyzer.log', level=logging.INFO,
                             format='%(asctime)s - %(levelname)s - %(message)s')
 
+        self.batch_file_processed.connect(self.on_batch_processing_complete)
+        self.batch_file_failed.connect(self.on_batch_file_error)
+        self._batch_pending = 0
+        self._batch_total = 0
+        self._batch_order = []
+        self._batch_futures = []
+        # Bumped for every batch run and by clear_all; results from older runs are dropped
+        self._batch_generation = 0
+        self._batch_executor = None
+        # Set while a background export runs; keeps the export buttons disabled
+        self._export_running = False
+        # Excel waveform summaries per batch file, reused across exports
+        self._waveform_summary_cache = {}
+
+        # Shared by every table cell instead of being rebuilt per item
+        self._cell_flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
         self.setup_ui()
         self.setup_styling()
         self.load_session()
@@ -208,6 +291,12 @@ class FinalKindleLogAnalyzer(QMainWindow):
         self.export_excel_btn.setVisible(False)
         export_layout.addWidget(self.export_excel_btn)
 
+        self.export_txt_files_btn = QPushButton("📝 Export TXT Files")
+        self.export_txt_files_btn.clicked.connect(self.export_txt_files)
+        self.export_txt_files_btn.setEnabled(False)
+        self.export_txt_files_btn.setVisible(False)
+        export_layout.addWidget(self.export_txt_files_btn)
+
         # Single Entry Export
         self.single_export_widget = QWidget()
         single_export_layout = QHBoxLayout(self.single_export_widget)
@@ -261,6 +350,22 @@ class FinalKindleLogAnalyzer(QMainWindow):
         # Comparison Tab
         self.create_comparison_tab()
 
+        # Result tabs are only (re)built when shown after their data changed
+        self._tab_updaters = {
+            self.summary_tab: self._refresh_summary_tab,
+            self.results_tab: self._refresh_results_tab,
+            self.waveform_boxes_tab: self._refresh_waveform_tab,
+            self.heights_tab: self._refresh_heights_tab,
+            self.batch_tab: self._refresh_batch_tab,
+        }
+        self._tab_dirty = {}
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+        # Coalesces bursts of invalidations into one refresh of the visible tab
+        self._tab_refresh_timer = QTimer(self)
+        self._tab_refresh_timer.setSingleShot(True)
+        self._tab_refresh_timer.setInterval(self.TAB_REFRESH_DELAY_MS)
+        self._tab_refresh_timer.timeout.connect(self._refresh_current_tab)
+
         layout.addWidget(self.tab_widget)
         panel.setLayout(layout)
         return panel
@@ -282,13 +387,25 @@ class FinalKindleLogAnalyzer(QMainWindow):
         self.results_tab = QWidget()
         layout = QVBoxLayout()
 
-        layout.addWidget(QLabel("📋 Main Results (Copy-friendly for Excel)"))
+        top_layout = QHBoxLayout()
+        top_layout.addWidget(QLabel("📋 Main Results (Copy-friendly for Excel)"))
+        top_layout.addStretch()
+
+        # Measuring contents walks every row, so only do it when asked
+        fit_results_btn = QPushButton("↔️ Fit Columns")
+        fit_results_btn.clicked.connect(lambda: self.results_table.resizeColumnsToContents())
+        fit_results_btn.setMaximumWidth(150)
+        top_layout.addWidget(fit_results_btn)
+        layout.addLayout(top_layout)
 
         # Main results table - optimized for copying to Excel
-        self.results_table = QTableWidget()
+        self.results_model = ResultsTableModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         self.results_table.setAlternatingRowColors(True)
         self.results_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.results_table.horizontalHeader().setStretchLastSection(True)
+        self.set_fixed_column_widths(self.results_table, ResultsTableModel.COLUMN_WIDTHS)
         layout.addWidget(self.results_table)
 
         self.results_tab.setLayout(layout)
@@ -314,6 +431,9 @@ class FinalKindleLogAnalyzer(QMainWindow):
         self.waveform_table.setAlternatingRowColors(True)
         self.waveform_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.waveform_table.horizontalHeader().setStretchLastSection(True)
+        # One handler for the whole Copy column instead of a button widget per row
+        self._waveform_row_copy = []
+        self.waveform_table.itemClicked.connect(self._on_waveform_cell_clicked)
         layout.addWidget(self.waveform_table)
 
         self.waveform_boxes_tab.setLayout(layout)
@@ -324,12 +444,23 @@ class FinalKindleLogAnalyzer(QMainWindow):
         self.heights_tab = QWidget()
         layout = QVBoxLayout()
 
-        layout.addWidget(QLabel("📏 All Heights & Waveforms Details"))
+        top_layout = QHBoxLayout()
+        top_layout.addWidget(QLabel("📏 All Heights & Waveforms Details"))
+        top_layout.addStretch()
+
+        fit_heights_btn = QPushButton("↔️ Fit Columns")
+        fit_heights_btn.clicked.connect(lambda: self.heights_table.resizeColumnsToContents())
+        fit_heights_btn.setMaximumWidth(150)
+        top_layout.addWidget(fit_heights_btn)
+        layout.addLayout(top_layout)
 
         # Detailed heights table
-        self.heights_table = QTableWidget()
+        self.heights_model = HeightsTableModel(self)
+        self.heights_table = QTableView()
+        self.heights_table.setModel(self.heights_model)
         self.heights_table.setAlternatingRowColors(True)
         self.heights_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.set_fixed_column_widths(self.heights_table, HeightsTableModel.COLUMN_WIDTHS)
         layout.addWidget(self.heights_table)
 
         self.heights_tab.setLayout(layout)
@@ -340,8 +471,11 @@ class FinalKindleLogAnalyzer(QMainWindow):
         self.batch_tab = QWidget()
         layout = QVBoxLayout()
 
-        self.batch_results_text = QTextEdit()
+        # Plain-text widget: line-based layout stays fast for large batches
+        self.batch_results_text = QPlainTextEdit()
         self.batch_results_text.setReadOnly(True)
+        self.batch_results_text.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.batch_results_text.setMaximumBlockCount(self.BATCH_TEXT_MAX_BLOCKS)
         layout.addWidget(self.batch_results_text)
 
         self.batch_tab.setLayout(layout)
@@ -450,35 +584,35 @@ class FinalKindleLogAnalyzer(QMainWindow):
         seq_a = [(h['height'], h['waveform']) for h in result_a['all_heights']]
         seq_b = [(h['height'], h['waveform']) for h in result_b['all_heights']]
 
-        table_html = """
+        table_rows = ["""
         <table border="1" cellpadding="5" cellspacing="0" style="border-collapse: collapse; width: 100%;">
             <tr style="background-color: #f0f0f0;">
                 <th>Step</th><th>Log A (Height, Waveform)</th><th>Log B (Height, Waveform)</th><th>Comparison</th>
             </tr>
-        """
+        """]
 
         matcher = difflib.SequenceMatcher(None, seq_a, seq_b)
         step = 1
         for tag, i1, i2, j1, j2 in matcher.get_opcodes():
             if tag == 'equal':
                 for i in range(i1, i2):
-                    table_html += f'<tr><td>{step}</td><td>{seq_a[i][0]}px, {seq_a[i][1]}</td><td>{seq_b[j1 + (i - i1)][0]}px, {seq_b[j1 + (i - i1)][1]}</td><td style="color: green;">Identical</td></tr>'
+                    table_rows.append(f'<tr><td>{step}</td><td>{seq_a[i][0]}px, {seq_a[i][1]}</td><td>{seq_b[j1 + (i - i1)][0]}px, {seq_b[j1 + (i - i1)][1]}</td><td style="color: green;">Identical</td></tr>')
                     step += 1
             if tag == 'delete':
                 for i in range(i1, i2):
-                    table_html += f'<tr style="background-color: #ffcccb;"><td>{step}</td><td>{seq_a[i][0]}px, {seq_a[i][1]}</td><td>-</td><td style="color: red;"><b>Removed from Log B</b></td></tr>'
+                    table_rows.append(f'<tr style="background-color: #ffcccb;"><td>{step}</td><td>{seq_a[i][0]}px, {seq_a[i][1]}</td><td>-</td><td style="color: red;"><b>Removed from Log B</b></td></tr>')
                     step += 1
             if tag == 'insert':
                 for j in range(j1, j2):
-                    table_html += f'<tr style="background-color: #ccffcc;"><td>{step}</td><td>-</td><td>{seq_b[j][0]}px, {seq_b[j][1]}</td><td style="color: blue;"><b>New in Log B</b></td></tr>'
+                    table_rows.append(f'<tr style="background-color: #ccffcc;"><td>{step}</td><td>-</td><td>{seq_b[j][0]}px, {seq_b[j][1]}</td><td style="color: blue;"><b>New in Log B</b></td></tr>')
                     step += 1
             if tag == 'replace':
                 for i, j in zip(range(i1, i2), range(j1, j2)):
-                    table_html += f'<tr style="background-color: #ffffcc;"><td>{step}</td><td>{seq_a[i][0]}px, {seq_a[i][1]}</td><td>{seq_b[j][0]}px, {seq_b[j][1]}</td><td style="color: orange;"><b>Deviation</b></td></tr>'
+                    table_rows.append(f'<tr style="background-color: #ffffcc;"><td>{step}</td><td>{seq_a[i][0]}px, {seq_a[i][1]}</td><td>{seq_b[j][0]}px, {seq_b[j][1]}</td><td style="color: orange;"><b>Deviation</b></td></tr>')
                     step += 1
 
-        table_html += "</table>"
-        html += table_html
+        table_rows.append("</table>")
+        html += "".join(table_rows)
 
         return html
 
@@ -507,112 +641,17 @@ class FinalKindleLogAnalyzer(QMainWindow):
         result = log_processor.process_iteration(log_content.split('\n'), "1", self.state.current_mode)
         return result
 
-    def create_iteration_waveform_box(self, result):
-        """Create a visual box for each iteration's waveform data"""
-        box = QFrame()
-        box.setFrameStyle(QFrame.StyledPanel)
-        box.setStyleSheet(f"""
-        QFrame {{
-            border: 2px solid {'#0d7377' if not self.state.dark_mode else '#14a085'};
-            border-radius: 8px;
-            padding: 10px;
-            margin: 5px;
-            background-color: {'#ffffff' if not self.state.dark_mode else '#404040'};
-        }}
-        QLabel {{
-            color: {'#333333' if not self.state.dark_mode else '#ffffff'};
-            font-size: 12px;
-        }}
-        """)
-
-        layout = QVBoxLayout(box)
-
-        # Header
-        header_label = QLabel(f"🔄 ITERATION_{result['iteration']:02d}")
-        header_label.setStyleSheet(f"""
-            font-weight: bold;
-            font-size: 14px;
-            color: {'#0d7377' if not self.state.dark_mode else '#14a085'};
-            padding: 5px;
-            background-color: {'#f0f8ff' if not self.state.dark_mode else '#2b2b2b'};
-            border-radius: 4px;
-        """)
-        header_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(header_label)
-
-        # Duration - highlighted
-        duration_label = QLabel(f"⏱️ Duration: {result['duration']:.3f} seconds")
-        duration_label.setStyleSheet(f"""
-            font-weight: bold;
-            background-color: yellow;
-            color: black;
-            padding: 3px;
-            border-radius: 3px;
-        """)
-        layout.addWidget(duration_label)
-
-        # Selected waveform - highlighted
-        selected_label = QLabel(f"🎯 Selected: {result['max_height_waveform']}")
-        selected_label.setStyleSheet(f"""
-            font-weight: bold;
-            background-color: yellow;
-            color: black;
-            padding: 3px;
-            border-radius: 3px;
-        """)
-        layout.addWidget(selected_label)
-
-        # Start/Stop info
-        times_label = QLabel(f"🔢 {result['start']} → {result['stop']}")
-        times_label.setStyleSheet("font-family: monospace; font-size: 11px;")
-        layout.addWidget(times_label)
-
-        # All heights and waveforms
-        layout.addWidget(QLabel("📏 All Heights:"))
-
-        for height_info in result['all_heights']:
-            is_selected = str(height_info['marker']) == str(result['marker'])
-            height_text = f"M{height_info['marker']}: {height_info['height']}px, {height_info['waveform']}"
-
-            height_label = QLabel(height_text)
-            if is_selected:
-                height_label.setStyleSheet("""
-                    background-color: yellow;
-                    color: black;
-                    font-weight: bold;
-                    padding: 2px;
-                    border-radius: 2px;
-                """)
-            else:
-                height_label.setStyleSheet("font-size: 11px; padding: 1px;")
-
-            layout.addWidget(height_label)
-
-        # Copy button for this iteration
-        copy_btn = QPushButton("📋 Copy Data")
-        copy_btn.setMaximumHeight(25)
-        copy_btn.clicked.connect(lambda checked, r=result: self.copy_iteration_data(r))
-        layout.addWidget(copy_btn)
-
-        return box
-
     def copy_iteration_data(self, result):
         """Copy iteration data to clipboard in the requested format"""
-        # Create a list to store the height and waveform information
-
-        # Iterate through all heights and extract the required information with numbering
-        height_waveform_data = []
-        for idx, height_info in enumerate(result['all_heights'], 1):
-            height = height_info['height']
-            waveform = height_info['waveform']
-            height_waveform_data.append(f"{idx}. Height - {height}, Waveform - {waveform}")
-
-        # Join all entries with newlines
-        data = "\n".join(height_waveform_data)
-
-        QApplication.clipboard().setText(data)
+        self.set_clipboard_text(format_waveform_lines(result))
         self.status_label.setText(f"Copied Iteration {result['iteration']} waveform data to clipboard")
 
+    def set_clipboard_text(self, text):
+        """Hand text to the clipboard as a single MIME payload"""
+        mime = QMimeData()
+        mime.setText(text)
+        QApplication.clipboard().setMimeData(mime)
+
     def copy_all_waveforms_data(self):
         """Copy all waveform data from all iterations for single entry mode."""
         self._copy_waveform_data_to_clipboard(self.state.results)
@@ -631,99 +670,145 @@ class FinalKindleLogAnalyzer(QMainWindow):
         for result in sorted(results_to_copy, key=lambda x: x['iteration']):
             iteration_header = f"ITERATION_{result['iteration']:02d}"
             all_waveforms_text.append(iteration_header)
-
-            height_waveform_data = []
-            for idx, height_info in enumerate(result['all_heights'], 1):
-                height = height_info['height']
-                waveform = height_info['waveform']
-                height_waveform_data.append(f"{idx}. Height - {height}, Waveform - {waveform}")
-
-            all_waveforms_text.append("\n".join(height_waveform_data))
+            all_waveforms_text.append(format_waveform_lines(result))
 
         final_text = "\n\n".join(all_waveforms_text)
-        QApplication.clipboard().setText(final_text)
+        self.set_clipboard_text(final_text)
         self.status_label.setText("Copied waveform data to clipboard.")
 
     def update_waveform_boxes(self, results_to_display=None):
         """Update the waveform boxes table"""
-        self.waveform_table.setRowCount(0)
-        self.waveform_table.setColumnCount(3) # Ensure 3 columns for all modes
-
-        if self.processing_mode.currentText() == "Batch Files":
-            for filename, results in self.state.batch_results.items():
-                row_position = self.waveform_table.rowCount()
-                self.waveform_table.insertRow(row_position)
-
-                # Add file header item
-                header_item = QTableWidgetItem(f"📄 {filename}")
-                header_item.setBackground(QColor("#e0e0e0"))
-                header_item.setFont(QFont("Arial", 10, QFont.Bold))
-                self.waveform_table.setItem(row_position, 0, header_item)
-                self.waveform_table.setSpan(row_position, 0, 1, 2) # Span first two columns
-
-                # Add "Copy All" button for the file
-                copy_all_btn = QPushButton("📋 Copy All Iterations")
-                copy_all_btn.setMaximumWidth(180)
-                copy_all_btn.clicked.connect(lambda checked, r=results: self.copy_file_waveforms_data(r))
-                self.waveform_table.setCellWidget(row_position, 2, copy_all_btn)
-
-                self.populate_waveform_boxes_table(results)
+        table = self.waveform_table
+        with self.suspended_updates(table):
+            table.setColumnCount(3) # Ensure 3 columns for all modes
+            table.setHorizontalHeaderLabels(["Iteration", "Waveform Data", "Copy"])
+            table.clearSpans()
+
+            if self.processing_mode.currentText() == "Batch Files":
+                batch_results = self.state.batch_results
+                row_count = len(batch_results) + sum(len(r) for r in batch_results.values())
+                self._reserve_waveform_rows(row_count)
+                row_position = 0
+                for filename, results in batch_results.items():
+                    # File header row with a "Copy All" cell for the file
+                    self._fill_waveform_row(row_position, f"📄 {filename}", "", "📋 Copy All Iterations", is_header=True)
+                    table.setSpan(row_position, 0, 1, 2) # Span first two columns
+                    self._waveform_row_copy[row_position] = (self.copy_file_waveforms_data, results)
+
+                    row_position = self.populate_waveform_boxes_table(results, row_position + 1)
+            else:
+                if results_to_display is None:
+                    results_to_display = self.state.results
+                row_count = len(results_to_display)
+                self._reserve_waveform_rows(row_count)
+                self.populate_waveform_boxes_table(results_to_display)
+
+        # Measuring every cell is O(rows * cols); large tables keep fixed, user-resizable widths
+        if row_count <= self.RESIZE_TO_CONTENTS_MAX_ROWS:
+            table.resizeColumnsToContents()
+            table.resizeRowsToContents()
         else:
-            if results_to_display is None:
-                results_to_display = self.state.results
-            self.populate_waveform_boxes_table(results_to_display)
+            header = table.horizontalHeader()
+            header.setSectionResizeMode(QHeaderView.Interactive)
+            header.resizeSection(0, 80)
+            header.resizeSection(1, 400)
 
-    def populate_waveform_boxes_table(self, results):
-        """Populate the waveform boxes table with results"""
-        self.waveform_table.setColumnCount(3)
-        self.waveform_table.setHorizontalHeaderLabels(["Iteration", "Waveform Data", "Copy"])
+    @contextmanager
+    def suspended_updates(self, view):
+        """Turn off painting and sorting on a view while it is repopulated.
 
-        if not results:
-            return
-
-        for result in results:
-            row_position = self.waveform_table.rowCount()
-            self.waveform_table.insertRow(row_position)
-
-            self.waveform_table.setItem(row_position, 0, QTableWidgetItem(str(result['iteration'])))
-
-            waveform_data = []
-            for idx, height_info in enumerate(result['all_heights'], 1):
-                height = height_info['height']
-                waveform = height_info['waveform']
-                waveform_data.append(f"{idx}. Height - {height}, Waveform - {waveform}")
+        Qt then paints the view once at the end instead of per row, and rows are
+        not re-sorted as each one is filled in.
+        """
+        sorting_enabled = view.isSortingEnabled()
+        view.setUpdatesEnabled(False)
+        view.setSortingEnabled(False)
+        try:
+            yield view
+        finally:
+            view.setSortingEnabled(sorting_enabled)
+            view.setUpdatesEnabled(True)
 
-            self.waveform_table.setItem(row_position, 1, QTableWidgetItem("\n".join(waveform_data)))
+    def _reserve_waveform_rows(self, row_count):
+        """Show row_count waveform rows, reusing the items of earlier refreshes.
 
-            copy_btn = QPushButton("📋 Copy")
-            copy_btn.setMaximumWidth(100)
-            copy_btn.clicked.connect(lambda checked, r=result: self.copy_iteration_data(r))
-            self.waveform_table.setCellWidget(row_position, 2, copy_btn)
+        Rows are only ever added; surplus rows from a larger previous refresh are
+        hidden so their items can be recycled by the next one.
+        """
+        table = self.waveform_table
+        allocated = table.rowCount()
+        if row_count > allocated:
+            table.setRowCount(row_count)
+            for row in range(allocated, row_count):
+                for col in range(3):
+                    table.setItem(row, col, self.make_table_item(""))
+            allocated = row_count
+
+        for row in range(allocated):
+            table.setRowHidden(row, row >= row_count)
+        self._waveform_row_copy = [None] * row_count
+
+    def _fill_waveform_row(self, row, iteration_text, waveform_text, copy_text, is_header=False):
+        """Overwrite the texts and header styling of a recycled waveform row"""
+        table = self.waveform_table
+        table.item(row, 0).setData(Qt.DisplayRole, iteration_text)
+        table.item(row, 1).setData(Qt.DisplayRole, waveform_text)
+        table.item(row, 2).setData(Qt.DisplayRole, copy_text)
+
+        first_item = table.item(row, 0)
+        first_item.setData(Qt.BackgroundRole, HEADER_BRUSH if is_header else None)
+        first_item.setData(Qt.FontRole, HEADER_FONT if is_header else None)
+
+    def populate_waveform_boxes_table(self, results, row_position=0):
+        """Fill reserved waveform table rows starting at row_position.
+
+        Returns the index of the first row after the ones written.
+        """
+        if not results:
+            return row_position
 
-        self.waveform_table.resizeColumnsToContents()
-        self.waveform_table.resizeRowsToContents()
+        for result in results:
+            self._fill_waveform_row(row_position, str(result['iteration']),
+                                    format_waveform_lines(result), "📋 Copy")
+            self._waveform_row_copy[row_position] = (self.copy_iteration_data, result)
+            row_position += 1
+
+        return row_position
+
+    def make_table_item(self, text):
+        """Create a read-only, selectable table item"""
+        item = QTableWidgetItem()
+        item.setFlags(self._cell_flags)
+        item.setData(Qt.DisplayRole, text)
+        return item
+
+    def _on_waveform_cell_clicked(self, item):
+        """Run the copy action registered for a clicked Copy cell"""
+        if item.column() != 2 or item.row() >= len(self._waveform_row_copy):
+            return
+        action = self._waveform_row_copy[item.row()]
+        if action:
+            copy_func, data = action
+            copy_func(data)
 
     def toggle_dark_mode(self, checked):
         """Toggle between dark and light mode"""
+        if checked == self.state.dark_mode:
+            return
         self.state.dark_mode = checked
         self.setup_styling()
         # Update waveform boxes with new styling
         if self.state.results or self.state.batch_results:
-            self.update_waveform_boxes()
+            self.invalidate_tabs([self.waveform_boxes_tab])
 
     def setup_styling(self):
         """Setup styling with dark mode support"""
-        if self.state.dark_mode:
-            with open('ui/dark_mode.qss', 'r') as f:
-                self.setStyleSheet(f.read())
-        else:
-            with open('ui/light_mode.qss', 'r') as f:
-                self.setStyleSheet(f.read())
+        self.setStyleSheet(_load_stylesheet('dark_mode.qss' if self.state.dark_mode else 'light_mode.qss'))
 
     def on_calculation_mode_changed(self):
         """Handle calculation mode change"""
-        mode_map = {0: "default", 1: "swipe", 2: "suspend"}
-        self.state.current_mode = mode_map.get(self.calc_mode_combo.currentIndex(), "default")
+        index = self.calc_mode_combo.currentIndex()
+        self.state.current_mode = self._MODES[index] if 0 <= index < len(self._MODES) else "default"
         self.status_label.setText(f"Mode: {self.calc_mode_combo.currentText()}")
 
     def on_processing_mode_changed(self, mode):
@@ -733,6 +818,7 @@ class FinalKindleLogAnalyzer(QMainWindow):
             self.batch_group.setVisible(False)
             self.export_zip_btn.setVisible(False)
             self.export_excel_btn.setVisible(False)
+            self.export_txt_files_btn.setVisible(False)
             self.single_export_widget.setVisible(True)
             self.test_case_input.setVisible(True)
             self.test_case_layout.itemAt(0).widget().setVisible(True)
@@ -742,6 +828,7 @@ class FinalKindleLogAnalyzer(QMainWindow):
             self.batch_group.setVisible(True)
             self.export_zip_btn.setVisible(True)
             self.export_excel_btn.setVisible(True)
+            self.export_txt_files_btn.setVisible(True)
             self.single_export_widget.setVisible(False)
             self.test_case_input.setVisible(False)
             self.test_case_layout.itemAt(0).widget().setVisible(False)
@@ -773,35 +860,83 @@ class FinalKindleLogAnalyzer(QMainWindow):
             return
 
         base_path, _ = os.path.splitext(save_path)
-
-        success_count = 0
-        error_messages = []
-
-        if pdf_checked:
-            pdf_path = base_path + ".pdf"
-            pdf_exporter = PdfExporter()
-            success, message = pdf_exporter.export_pdf_report(self.state.results, pdf_path, self.state.current_mode)
-            if success:
-                success_count += 1
-            else:
-                error_messages.append(f"PDF Error: {message}")
-                logging.error(f"PDF Export Error: {message}")
-
-        if txt_checked:
-            txt_path = base_path + ".txt"
-            txt_exporter = TxtExporter()
-            success, message = txt_exporter.export_txt_report(self.state.results, txt_path)
-            if success:
-                success_count += 1
-            else:
-                error_messages.append(f"TXT Error: {message}")
-                logging.error(f"TXT Export Error: {message}")
-
+        results = self.state.results
+        current_mode = self.state.current_mode
+
+        def run_exports():
+            success_count = 0
+            error_messages = []
+
+            if pdf_checked:
+                pdf_path = base_path + ".pdf"
+                pdf_exporter = PdfExporter()
+                success, message = pdf_exporter.export_pdf_report(results, pdf_path, current_mode)
+                if success:
+                    success_count += 1
+                else:
+                    error_messages.append(f"PDF Error: {message}")
+                    logging.error(f"PDF Export Error: {message}")
+
+            if txt_checked:
+                txt_path = base_path + ".txt"
+                txt_exporter = TxtExporter()
+                success, message = txt_exporter.export_txt_report(results, txt_path)
+                if success:
+                    success_count += 1
+                else:
+                    error_messages.append(f"TXT Error: {message}")
+                    logging.error(f"TXT Export Error: {message}")
+
+            return success_count, error_messages
+
+        self.start_export_job(run_exports, self.on_single_export_complete)
+
+    def on_single_export_complete(self, outcome):
+        """Report the outcome of a single-entry export"""
+        success_count, error_messages = outcome
         if not error_messages:
             QMessageBox.information(self, "Success", f"Successfully exported {success_count} report(s).")
         else:
             QMessageBox.critical(self, "Export Error", "\n".join(error_messages))
 
+    def start_export_job(self, func, on_complete):
+        """Run an export callable on the global thread pool, keeping the UI responsive"""
+        self._export_running = True
+        self.enable_export_buttons()
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(True)
+        self.status_label.setText("Exporting...")
+
+        job = _ExportJob(func, self)
+        job.signals.finished.connect(self.on_export_job_done)
+        job.signals.failed.connect(self.on_export_job_done)
+        job.signals.finished.connect(on_complete)
+        job.signals.failed.connect(self.on_export_job_failed)
+        QThreadPool.globalInstance().start(job)
+
+    def on_export_job_done(self, _outcome):
+        """Restore the export controls once a background export ends"""
+        self.sender().deleteLater()
+        self.progress_bar.setVisible(False)
+        self.progress_bar.setRange(0, 100)
+        self._export_running = False
+        self.enable_export_buttons()
+        self.status_label.setText("Export finished")
+
+    def on_export_job_failed(self, error):
+        """Handle an exception raised inside a background export"""
+        logging.error(f"Export Error: {error}")
+        QMessageBox.critical(self, "Export Error", f"Error during export: {error}")
+
+    def show_export_result(self, outcome):
+        """Report a (success, message) result returned by an exporter"""
+        success, message = outcome
+        if success:
+            QMessageBox.information(self, "Success", message)
+        else:
+            QMessageBox.critical(self, "Error", message)
+            logging.error(message)
+
     def add_iteration(self):
         """Add iteration data"""
         log_content = self.log_input.toPlainText().strip()
@@ -809,8 +944,7 @@ class FinalKindleLogAnalyzer(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please enter log data")
             return
 
-        iteration_header = f"\nITERATION_{self.state.current_iteration:02d}\n"
-        self.state.all_iterations_data += iteration_header + log_content + "\n"
+        self.state.append_iteration_data(_iteration_header(self.state.current_iteration), log_content, "\n")
 
         self.state.current_iteration += 1
         self.log_input.clear()
@@ -820,7 +954,8 @@ class FinalKindleLogAnalyzer(QMainWindow):
 
     def process_all_iterations(self):
         """Process all iterations"""
-        if not self.state.all_iterations_data:
+        all_iterations_data = self.state.all_iterations_data
+        if not all_iterations_data:
             QMessageBox.warning(self, "Warning", "No iterations to process")
             return
 
@@ -828,7 +963,7 @@ class FinalKindleLogAnalyzer(QMainWindow):
         self.status_label.setText("Processing iterations...")
 
         # Create and start log processor thread
-        self.log_processor = LogProcessor(self.state.all_iterations_data, self.state.current_mode)
+        self.log_processor = LogProcessor(all_iterations_data, self.state.current_mode)
         self.log_processor.progress_updated.connect(self.progress_bar.setValue)
         self.log_processor.result_ready.connect(self.on_single_processing_complete)
         self.log_processor.error_occurred.connect(self.on_processing_error)
@@ -844,15 +979,29 @@ class FinalKindleLogAnalyzer(QMainWindow):
         self.status_label.setText(f"Processed successfully")
         self.save_session()
 
-    def on_batch_processing_complete(self, data, filename):
+    def on_batch_processing_complete(self, data, filename, generation):
         """Handle batch processing completion for a single file."""
+        if generation != self._batch_generation:
+            return
         self.state.batch_results[filename] = data['results']
+        self._batch_file_finished()
+
+    def _batch_file_finished(self):
+        """Advance batch progress and refresh the displays once every file is done"""
+        self._batch_pending -= 1
+        total = self._batch_total
+        self.progress_bar.setValue((total - self._batch_pending) * 100 // (total or 1))
         # Check if all files have been processed
-        if len(self.state.batch_results) == len(self.state.loaded_files):
+        if self._batch_pending <= 0:
+            self._batch_futures = []
+            self.process_batch_btn.setEnabled(bool(self.state.loaded_files))
+            # Files finish in any order; present them in the order they were selected
+            batch_results = self.state.batch_results
+            self.state.batch_results = {name: batch_results[name] for name in self._batch_order if name in batch_results}
             self.progress_bar.setVisible(False)
             self.update_all_displays()
             self.enable_export_buttons()
-            self.status_label.setText(f"Processed {len(self.state.loaded_files)} files")
+            self.status_label.setText(f"Processed {self._batch_total} files")
             self.save_session()
 
     def on_processing_error(self, error):
@@ -866,27 +1015,67 @@ class FinalKindleLogAnalyzer(QMainWindow):
         if not self.state.results and not self.state.batch_results:
             return
 
+        self.invalidate_tabs()
+
+    def invalidate_tabs(self, tabs=None):
+        """Mark result tabs stale (all by default) and schedule a refresh of the visible one"""
+        for tab in (tabs if tabs is not None else self._tab_updaters):
+            self._tab_dirty[tab] = True
+        # Restarting the timer folds repeated calls into a single refresh
+        self._tab_refresh_timer.start()
+
+    def _refresh_current_tab(self):
+        self._on_tab_changed(self.tab_widget.currentIndex())
+
+    def _on_tab_changed(self, index):
+        """Rebuild the newly shown tab if its data changed since it was last built"""
+        tab = self.tab_widget.widget(index)
+        if self._tab_dirty.get(tab):
+            self._tab_dirty[tab] = False
+            self._tab_updaters[tab]()
+
+    def _refresh_summary_tab(self):
         if self.processing_mode.currentText() == "Batch Files":
             self.update_summary_display()
-            self.update_batch_display()
-            results_to_display = [item for sublist in self.state.batch_results.values() for item in sublist]
-            self.update_results_table(results_to_display)
-            self.update_heights_table(results_to_display)
-            self.update_waveform_boxes()
         else:
             self.update_summary_display(self.state.results)
+
+    def _refresh_results_tab(self):
+        if self.processing_mode.currentText() == "Batch Files":
+            # Batch rows are built per file straight from batch_results
+            self.update_results_table()
+        else:
             self.update_results_table(self.state.results)
+
+    def _refresh_waveform_tab(self):
+        if self.processing_mode.currentText() == "Batch Files":
+            self.update_waveform_boxes()
+        else:
             self.update_waveform_boxes(self.state.results)
+
+    def _refresh_heights_tab(self):
+        if self.processing_mode.currentText() == "Batch Files":
+            self.update_heights_table()
+        else:
             self.update_heights_table(self.state.results)
+
+    def _refresh_batch_tab(self):
+        if self.processing_mode.currentText() == "Batch Files":
+            self.update_batch_display()
+        else:
             self.batch_results_text.clear()
 
 
     def update_summary_display(self, results_to_display=None):
         """Update summary display"""
+        # Shared by every file's summary in this update
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        calc_mode = self.calc_mode_combo.currentText()
+
         if self.processing_mode.currentText() == "Batch Files":
             self.summary_text.clear()
             for filename, results in self.state.batch_results.items():
-                self.generate_summary_for_file(filename, results)
+                self.generate_summary_for_file(filename, results, timestamp, calc_mode)
             return
 
         if results_to_display is None:
@@ -896,159 +1085,111 @@ class FinalKindleLogAnalyzer(QMainWindow):
             self.summary_text.clear()
             return
 
-        self.generate_summary_for_file(self.test_case_input.text() or "Single Entry", results_to_display)
+        self.generate_summary_for_file(self.test_case_input.text() or "Single Entry", results_to_display,
+                                       timestamp, calc_mode)
 
-    def generate_summary_for_file(self, filename, results):
+    def generate_summary_for_file(self, filename, results, timestamp=None, calc_mode=None):
         if not results:
             return
 
+        if timestamp is None:
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        if calc_mode is None:
+            calc_mode = self.calc_mode_combo.currentText()
+
         total_iterations = len(results)
-        durations = [r['duration'] for r in results]
-        avg_duration = sum(durations) / total_iterations
-        min_duration = min(durations)
-        max_duration = max(durations)
+        avg_duration, min_duration, max_duration, durations = duration_stats(results)
 
-        summary_html = f"""
+        parts = [f"""
         <h2>📊 Processing Summary for {filename}</h2>
         <table border="1" cellpadding="8" cellspacing="0" style="border-collapse: collapse;">
         <tr><td><b>Test Case:</b></td><td>{filename}</td></tr>
-        <tr><td><b>Processing Mode:</b></td><td>{self.calc_mode_combo.currentText()}</td></tr>
+        <tr><td><b>Processing Mode:</b></td><td>{calc_mode}</td></tr>
         <tr><td><b>Total Iterations:</b></td><td>{total_iterations}</td></tr>
         <tr><td><b>Average Duration:</b></td><td style="background-color: yellow;">{avg_duration:.3f} seconds</td></tr>
         <tr><td><b>Min Duration:</b></td><td>{min_duration:.3f} seconds</td></tr>
         <tr><td><b>Max Duration:</b></td><td>{max_duration:.3f} seconds</td></tr>
-        <tr><td><b>Processing Time:</b></td><td>{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</td></tr>
+        <tr><td><b>Processing Time:</b></td><td>{timestamp}</td></tr>
         </table>
 
         <h3>📋 Iteration with Average for {filename}:</h3>
         <table border="1" cellpadding="8" cellspacing="0" style="border-collapse: collapse; margin-top: 10px;">
         <tr style="background-color: #f0f0f0;">
         <td><b>Test case name</b></td>
-"""
-        for i in range(1, total_iterations + 1):
-            summary_html += f"<td><b>IT_{i:02d}</b></td>"
-        summary_html += "<td><b>AVG</b></td></tr>"
-        summary_html += f"<tr><td><b>{filename}</b></td>"
-        for result in results:
-            summary_html += f"<td>{result['duration']:.3f}</td>"
-        summary_html += f"<td>{avg_duration:.3f}</td></tr>"
-        summary_html += "</table><br><hr><br>"
-
-        self.summary_text.append(summary_html)
+"""]
+        parts.extend(f"<td><b>IT_{i:02d}</b></td>" for i in range(1, total_iterations + 1))
+        parts.append("<td><b>AVG</b></td></tr>")
+        parts.append(f"<tr><td><b>{filename}</b></td>")
+        parts.extend(f"<td>{duration:.3f}</td>" for duration in durations.tolist())
+        parts.append(f"<td>{avg_duration:.3f}</td></tr>")
+        parts.append("</table><br><hr><br>")
+
+        self.summary_text.append("".join(parts))
+
+    def set_fixed_column_widths(self, view, widths):
+        """Give a table fixed, user-resizable column widths instead of measuring contents"""
+        header = view.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        for column, width in enumerate(widths):
+            header.resizeSection(column, width)
 
     def update_results_table(self, results_to_display=None):
         """Update main results table - optimized for copying"""
-        self.results_table.setRowCount(0)
         if self.processing_mode.currentText() == "Batch Files":
-            self.results_table.setColumnCount(1)
+            rows = []
             for filename, results in self.state.batch_results.items():
-                row_position = self.results_table.rowCount()
-                self.results_table.insertRow(row_position)
-                header_item = QTableWidgetItem(f"📄 {filename}")
-                header_item.setBackground(QColor("#e0e0e0"))
-                header_item.setFont(QFont("Arial", 10, QFont.Bold))
-                self.results_table.setItem(row_position, 0, header_item)
-                self.results_table.setSpan(row_position, 0, 1, 8)
-                self.populate_results_table(results)
+                rows.append(filename)
+                rows.extend(results)
         else:
             if results_to_display is None:
                 results_to_display = self.state.results
-            self.populate_results_table(results_to_display)
-
-    def populate_results_table(self, results):
-        self.results_table.setColumnCount(8)
-        headers = ['Iteration', 'Duration (seconds)', 'Start Time', 'Stop Time',
-                   'Marker', 'Height', 'Selected Waveform', 'Mode']
-        self.results_table.setHorizontalHeaderLabels(headers)
-
-        for result in results:
-            row_position = self.results_table.rowCount()
-            self.results_table.insertRow(row_position)
-            self.results_table.setItem(row_position, 0, QTableWidgetItem(str(result['iteration'])))
-            duration_item = QTableWidgetItem(f"{result['duration']:.3f}")
-            duration_item.setBackground(QBrush(QColor(255, 255, 0, 100)))
-            self.results_table.setItem(row_position, 1, duration_item)
-            self.results_table.setItem(row_position, 2, QTableWidgetItem(str(result['start'])))
-            self.results_table.setItem(row_position, 3, QTableWidgetItem(str(result['stop'])))
-            self.results_table.setItem(row_position, 4, QTableWidgetItem(str(result['marker'])))
-            self.results_table.setItem(row_position, 5, QTableWidgetItem(str(result['max_height'])))
-            waveform_item = QTableWidgetItem(result['max_height_waveform'])
-            waveform_item.setBackground(QBrush(QColor(255, 255, 0, 100)))
-            self.results_table.setItem(row_position, 6, waveform_item)
-            self.results_table.setItem(row_position, 7, QTableWidgetItem(result['mode']))
-        self.results_table.resizeColumnsToContents()
+            rows = list(results_to_display)
+        with self.suspended_updates(self.results_table):
+            self.results_model.set_rows(rows)
+            self.span_file_header_rows(self.results_table, self.results_model)
 
     def update_heights_table(self, results_to_display=None):
         """Update detailed heights and waveforms table"""
-        self.heights_table.setRowCount(0)
         if self.processing_mode.currentText() == "Batch Files":
-            self.heights_table.setColumnCount(1)
+            rows = []
             for filename, results in self.state.batch_results.items():
-                row_position = self.heights_table.rowCount()
-                self.heights_table.insertRow(row_position)
-                header_item = QTableWidgetItem(f"📄 {filename}")
-                header_item.setBackground(QColor("#e0e0e0"))
-                header_item.setFont(QFont("Arial", 10, QFont.Bold))
-                self.heights_table.setItem(row_position, 0, header_item)
-                self.heights_table.setSpan(row_position, 0, 1, 6)
-                self.populate_heights_table(results)
+                rows.append(filename)
+                rows.extend(HeightsTableModel.flatten(results))
         else:
             if results_to_display is None:
                 results_to_display = self.state.results
-            self.populate_heights_table(results_to_display)
+            rows = HeightsTableModel.flatten(results_to_display)
+        with self.suspended_updates(self.heights_table):
+            self.heights_model.set_rows(rows)
+            self.span_file_header_rows(self.heights_table, self.heights_model)
 
-    def populate_heights_table(self, results):
-        self.heights_table.setColumnCount(6)
-        headers = ['Iteration', 'Marker', 'Height', 'Waveform', 'Selected', 'End Time']
-        self.heights_table.setHorizontalHeaderLabels(headers)
-        for result in results:
-            for height_info in result['all_heights']:
-                row_position = self.heights_table.rowCount()
-                self.heights_table.insertRow(row_position)
-                self.heights_table.setItem(row_position, 0, QTableWidgetItem(str(result['iteration'])))
-                self.heights_table.setItem(row_position, 1, QTableWidgetItem(str(height_info['marker'])))
-                self.heights_table.setItem(row_position, 2, QTableWidgetItem(str(height_info['height'])))
-                self.heights_table.setItem(row_position, 3, QTableWidgetItem(height_info['waveform']))
-                is_selected = str(height_info['marker']) == str(result['marker'])
-                selected_item = QTableWidgetItem("✓" if is_selected else "")
-                if is_selected:
-                    selected_item.setBackground(QBrush(QColor(255, 255, 0, 150)))
-                self.heights_table.setItem(row_position, 4, selected_item)
-                end_time = ""
-                if 'all_end_times' in result and str(height_info['marker']) in result['all_end_times']:
-                    end_time = str(result['all_end_times'][str(height_info['marker'])]['time'])
-                self.heights_table.setItem(row_position, 5, QTableWidgetItem(end_time))
-        self.heights_table.resizeColumnsToContents()
+    def span_file_header_rows(self, view, model):
+        """Stretch batch file header rows across every column"""
+        view.clearSpans()
+        for row in model.header_rows():
+            view.setSpan(row, 0, 1, model.columnCount())
 
     def update_batch_display(self):
         """Update batch results display"""
         if not self.state.batch_results:
             return
 
-        batch_html = "<h2>📁 Batch Processing Results</h2>"
+        row_format = "{:<10} {:>10} {:>10} {:>10} {:>8}  {}"
+        lines = ["📁 Batch Processing Results", ""]
 
         for filename, results in self.state.batch_results.items():
-            batch_html += f"<h3>📄 {filename}</h3>"
+            lines.append(f"📄 {filename}")
             if results:
-                batch_html += "<table border='1' cellpadding='5' cellspacing='0'>"
-                batch_html += "<tr><th>Iteration</th><th>Duration</th><th>Start</th><th>Stop</th><th>Height</th><th>Waveform</th></tr>"
-
+                lines.append(row_format.format("Iteration", "Duration", "Start", "Stop", "Height", "Waveform"))
                 for result in results:
-                    batch_html += f"""
-                    <tr>
-                    <td>{result['iteration']}</td>
-                    <td style='background-color: yellow;'>{result['duration']:.3f}</td>
-                    <td>{result['start']}</td>
-                    <td>{result['stop']}</td>
-                    <td>{result['max_height']}</td>
-                    <td style='background-color: yellow;'>{result['max_height_waveform']}</td>
-                    </tr>
-                    """
-                batch_html += "</table><br>"
+                    lines.append(row_format.format(
+                        result['iteration'], format_duration(result), result['start'],
+                        result['stop'], result['max_height'], result['max_height_waveform']))
             else:
-                batch_html += "<p>No valid results found.</p>"
+                lines.append("No valid results found.")
+            lines.append("")
 
-        self.batch_results_text.setHtml(batch_html)
+        self.batch_results_text.setPlainText("\n".join(lines))
 
     def export_zip_report(self):
         """Export all reports into a single ZIP file."""
@@ -1062,13 +1203,36 @@ class FinalKindleLogAnalyzer(QMainWindow):
         if not zip_path:
             return
 
-        pdf_exporter = PdfExporter()
-        success, message = pdf_exporter.export_zip_report(self.state.batch_results, zip_path, self.state.current_mode)
-        if success:
-            QMessageBox.information(self, "Success", message)
-        else:
-            QMessageBox.critical(self, "Error", message)
-            logging.error(message)
+        batch_results = dict(self.state.batch_results)
+        current_mode = self.state.current_mode
+        self.start_export_job(
+            lambda: PdfExporter().export_zip_report(batch_results, zip_path, current_mode),
+            self.show_export_result)
+
+    def export_txt_files(self):
+        """Export one TXT report per batch file into a chosen folder."""
+        if not self.state.batch_results:
+            QMessageBox.warning(self, "Warning", "No results to export.")
+            return
+
+        output_dir = QFileDialog.getExistingDirectory(self, "Select Folder for TXT Reports")
+
+        if not output_dir:
+            return
+
+        # Named like the TXT reports inside the ZIP export
+        base_names = report_base_names(self.state.batch_results)
+        jobs = [(results, os.path.join(output_dir, f"{base_names[filename]}_report.txt"))
+                for filename, results in self.state.batch_results.items()]
+        self.start_export_job(lambda: self._export_txt_jobs(jobs, output_dir), self.show_export_result)
+
+    @staticmethod
+    def _export_txt_jobs(jobs, output_dir):
+        """Write the TXT reports in worker processes; returns (success, message)"""
+        errors = [str(error) for error in TxtExporter().export_many(jobs) if error is not None]
+        if errors:
+            return False, "Failed to create TXT files:\n" + "\n".join(errors)
+        return True, f"{len(jobs)} TXT report(s) exported to {output_dir}"
 
     def export_excel_with_highlighting(self):
         """Export to Excel with the new format."""
@@ -1085,26 +1249,30 @@ class FinalKindleLogAnalyzer(QMainWindow):
         if not filename:
             return
 
-        excel_exporter = ExcelExporter()
-        success, message = excel_exporter.export_excel_with_highlighting(self.state.batch_results, filename)
-        if success:
-            QMessageBox.information(self, "Success", message)
-        else:
-            QMessageBox.critical(self, "Error", message)
-            logging.error(message)
+        batch_results = dict(self.state.batch_results)
+        self.start_export_job(
+            lambda: ExcelExporter(self._waveform_summary_cache).export_excel_with_highlighting(batch_results, filename),
+            self.show_export_result)
 
     def select_batch_files(self):
         """Select files for batch processing"""
+        # Native Linux dialogs stat every entry up front and can hang on large log
+        # directories; Qt's own dialog lists entries lazily.
+        options = QFileDialog.Options()
+        if sys.platform.startswith('linux'):
+            options |= QFileDialog.DontUseNativeDialog
         files, _ = QFileDialog.getOpenFileNames(
             self, "Select Log Files", "",
-            "Log Files (*.log *.txt);;All Files (*)"
+            "Log Files (*.log *.txt *.zip);;All Files (*)",
+            options=options
         )
         if files:
             self.state.loaded_files = files
             self.files_list.clear()
             for file in files:
                 self.files_list.addItem(os.path.basename(file))
-            self.process_batch_btn.setEnabled(True)
+            # Stays disabled until a running batch finishes
+            self.process_batch_btn.setEnabled(self._batch_pending <= 0)
 
     def clear_batch_files(self):
         """Clear selected batch files"""
@@ -1117,32 +1285,97 @@ class FinalKindleLogAnalyzer(QMainWindow):
         if not self.state.loaded_files:
             return
 
+        self._cancel_batch()
         self.status_label.setText("Processing batch files...")
         self.state.batch_results.clear()
-        self.state.threads = []
 
+        jobs = []
         for file_path in self.state.loaded_files:
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-
-                filename = os.path.basename(file_path)
-                self.state.current_processing_file = filename
-                # Process content using log processor
-                log_processor = LogProcessor(content, self.state.current_mode)
-                log_processor.result_ready.connect(lambda data, fn=filename: self.on_batch_processing_complete(data, fn))
-                self.state.threads.append(log_processor)
-                log_processor.start()
-
-            except Exception as e:
+                jobs.extend((file_path, name, member, size) for name, member, size in list_batch_sources(file_path))
+            except (OSError, zipfile.BadZipFile) as e:
                 logging.error(f"Error processing {file_path}: {str(e)}")
                 QMessageBox.warning(self, "Warning", f"Error processing {file_path}: {str(e)}")
+        if not jobs:
+            self.status_label.setText("No log files to process")
+            return
+
+        self._batch_total = self._batch_pending = len(jobs)
+        self._batch_order = [name for _path, name, _member, _size in jobs]
+        self._batch_generation += 1
+        generation = self._batch_generation
+        self.process_batch_btn.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+
+        # Submit the largest inputs first so one big file doesn't run alone at the end
+        jobs.sort(key=lambda job: job[3], reverse=True)
+        for file_path, name, member, _size in jobs:
+            try:
+                future = self.batch_executor().submit(process_log_file, file_path, self.state.current_mode, member)
+            except BrokenProcessPool:
+                # A worker died in an earlier batch; start a fresh pool
+                self._batch_executor = None
+                future = self.batch_executor().submit(process_log_file, file_path, self.state.current_mode, member)
+            self._batch_futures.append(future)
+            future.add_done_callback(
+                lambda f, fp=file_path, fn=name, gen=generation: self._on_batch_future_done(f, fp, fn, gen))
+
+    def batch_executor(self):
+        """Return the bounded process pool used for batch parsing, starting it on first use.
+
+        Parsing is CPU-bound Python, so files run in separate processes rather than
+        threads. The pool is kept between batches so worker start-up is paid once.
+        Spawned (not forked) workers never inherit the Qt event loop state.
+        """
+        if self._batch_executor is None:
+            self._batch_executor = ProcessPoolExecutor(
+                max_workers=min(self.MAX_BATCH_WORKERS, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"))
+        return self._batch_executor
+
+    def closeEvent(self, event):
+        """Stop batch workers when the window closes"""
+        if self._batch_executor is not None:
+            self._batch_executor.shutdown(wait=False, cancel_futures=True)
+            self._batch_executor = None
+        super().closeEvent(event)
+
+    def _cancel_batch(self):
+        """Abandon the running batch: queued files are cancelled, late results ignored"""
+        self._batch_generation += 1
+        for future in self._batch_futures:
+            future.cancel()
+        self._batch_futures = []
+        if self._batch_pending > 0:
+            self._batch_pending = self._batch_total = 0
+            self.progress_bar.setVisible(False)
+
+    def _on_batch_future_done(self, future, file_path, filename, generation):
+        """Forward a finished batch job to the GUI thread (runs on a pool thread)"""
+        try:
+            data = future.result()
+        except Exception as e:
+            self.batch_file_failed.emit(file_path, str(e), generation)
+        else:
+            self.batch_file_processed.emit(data, filename, generation)
+
+    def on_batch_file_error(self, file_path, error, generation):
+        """Handle a batch file that could not be processed"""
+        if generation != self._batch_generation:
+            return
+        logging.error(f"Error processing {file_path}: {error}")
+        QMessageBox.warning(self, "Warning", f"Error processing {file_path}: {error}")
+        self._batch_file_finished()
 
     def enable_export_buttons(self):
-        """Enable export buttons"""
-        self.export_zip_btn.setEnabled(True)
-        self.export_excel_btn.setEnabled(True)
-        self.export_report_btn.setEnabled(True)
+        """Enable the export buttons that have results to export, unless an export is running"""
+        idle = not self._export_running
+        has_batch = idle and bool(self.state.batch_results)
+        self.export_zip_btn.setEnabled(has_batch)
+        self.export_excel_btn.setEnabled(has_batch)
+        self.export_txt_files_btn.setEnabled(has_batch)
+        self.export_report_btn.setEnabled(idle and bool(self.state.results))
 
     def save_session(self):
         """Saves the current session state to a file."""
@@ -1166,6 +1399,12 @@ class FinalKindleLogAnalyzer(QMainWindow):
                         data = json.load(f)
                         self.state.from_dict(data)
 
+                    # Sync the toggle with the restored theme without re-entering toggle_dark_mode
+                    self.dark_mode_toggle.blockSignals(True)
+                    self.dark_mode_toggle.setChecked(self.state.dark_mode)
+                    self.dark_mode_toggle.blockSignals(False)
+                    self.setup_styling()
+
                     # Refresh UI based on loaded state
                     self.update_all_displays()
                     self.enable_export_buttons()
@@ -1178,21 +1417,42 @@ class FinalKindleLogAnalyzer(QMainWindow):
                     logging.error(f"Error loading session: {e}")
                     QMessageBox.critical(self, "Error", f"Could not load the session file: {e}")
 
+    @contextmanager
+    def _quiet_clear(self, *widgets):
+        """Block signals and painting on several widgets so they repaint once after clearing"""
+        for widget in widgets:
+            widget.blockSignals(True)
+            widget.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            for widget in widgets:
+                widget.setUpdatesEnabled(True)
+                widget.blockSignals(False)
+
     def clear_all(self):
         """Clear all data"""
         self.state.clear_all()
+        self._cancel_batch()
+        self._tab_refresh_timer.stop()
+        self._tab_dirty.clear()
+        self._waveform_summary_cache.clear()
+        clear_cache()
+
+        with self._quiet_clear(self.log_input, self.files_list, self.summary_text, self.results_table,
+                               self.heights_table, self.batch_results_text, self.waveform_table):
+            self.log_input.clear()
+            self.files_list.clear()
+            self.summary_text.clear()
+            self.results_model.set_rows([])
+            self.heights_model.set_rows([])
+            self.results_table.clearSpans()
+            self.heights_table.clearSpans()
+            self.batch_results_text.clear()
+            self.waveform_table.setRowCount(0)
+        self._waveform_row_copy = []
 
-        self.log_input.clear()
-        self.files_list.clear()
-        self.summary_text.clear()
-        self.results_table.setRowCount(0)
-        self.heights_table.setRowCount(0)
-        self.batch_results_text.clear()
-        self.waveform_table.setRowCount(0)
-
-        self.export_zip_btn.setEnabled(False)
-        self.export_excel_btn.setEnabled(False)
-        self.export_report_btn.setEnabled(False)
+        self.enable_export_buttons()
         self.process_all_btn.setEnabled(False)
         self.process_batch_btn.setEnabled(False)
         self.clear_comparison_fields()
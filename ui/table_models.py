@@ -0,0 +1,150 @@
+"""
+Table models for the results views.
+Cells are formatted on demand, so only rows Qt actually paints cost anything.
+"""
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QBrush, QColor, QFont
+
+from logic.log_processor import format_duration
+
+# Shared, never-mutated paint objects handed out for every cell that needs them
+HEADER_BRUSH = QBrush(QColor("#e0e0e0"))
+HEADER_FONT = QFont("Arial", 10, QFont.Bold)
+HIGHLIGHT_BRUSH = QBrush(QColor(255, 255, 0, 100))
+SELECTED_BRUSH = QBrush(QColor(255, 255, 0, 150))
+
+class _ResultRowsModel(QAbstractTableModel):
+    """Base model over a flat row list.
+
+    A row is either a file name (str), shown as a bold batch header spanning the
+    table, or a model-specific record rendered by the cell_text(row, column)
+    formatter each subclass passes in.
+    """
+    HEADERS = []
+    # Columns painted with the highlight brush
+    HIGHLIGHT_COLUMNS = ()
+
+    def __init__(self, cell_text, parent=None):
+        super().__init__(parent)
+        self.cell_text = cell_text
+        self._rows = []
+
+    def set_rows(self, rows):
+        """Replace all rows with a single model reset"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def header_rows(self):
+        """Indexes of batch file header rows"""
+        return [i for i, row in enumerate(self._rows) if isinstance(row, str)]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+
+        if isinstance(row, str):
+            if column != 0:
+                return None
+            if role == Qt.DisplayRole:
+                return f"📄 {row}"
+            if role == Qt.BackgroundRole:
+                return HEADER_BRUSH
+            if role == Qt.FontRole:
+                return HEADER_FONT
+            return None
+
+        if role == Qt.DisplayRole:
+            return self.cell_text(row, column)
+        if role == Qt.BackgroundRole:
+            return self.cell_background(row, column)
+        return None
+
+    def cell_background(self, row, column):
+        return HIGHLIGHT_BRUSH if column in self.HIGHLIGHT_COLUMNS else None
+
+
+class ResultsTableModel(_ResultRowsModel):
+    """One row per iteration result"""
+    HEADERS = ['Iteration', 'Duration (seconds)', 'Start Time', 'Stop Time',
+               'Marker', 'Height', 'Selected Waveform', 'Mode']
+    HIGHLIGHT_COLUMNS = (1, 6)
+    COLUMN_WIDTHS = (80, 130, 160, 160, 80, 80, 160, 80)
+
+    def __init__(self, parent=None):
+        super().__init__(self._cell_text, parent)
+
+    @staticmethod
+    def _cell_text(result, column):
+        if column == 0:
+            return str(result['iteration'])
+        if column == 1:
+            return format_duration(result)
+        if column == 2:
+            return str(result['start'])
+        if column == 3:
+            return str(result['stop'])
+        if column == 4:
+            return str(result['marker'])
+        if column == 5:
+            return str(result['max_height'])
+        if column == 6:
+            return result['max_height_waveform']
+        return result['mode']
+
+
+class HeightsTableModel(_ResultRowsModel):
+    """One row per screen update (height/waveform) of every iteration"""
+    HEADERS = ['Iteration', 'Marker', 'Height', 'Waveform', 'Selected', 'End Time']
+    COLUMN_WIDTHS = (80, 80, 80, 160, 80, 120)
+
+    def __init__(self, parent=None):
+        super().__init__(self._cell_text, parent)
+
+    @staticmethod
+    def flatten(results):
+        """Expand results into (result, height_info) rows"""
+        return [(result, height_info) for result in results for height_info in result['all_heights']]
+
+    @classmethod
+    def _cell_text(cls, row, column):
+        result, height_info = row
+        if column == 0:
+            return str(result['iteration'])
+        if column == 1:
+            return str(height_info['marker'])
+        if column == 2:
+            return str(height_info['height'])
+        if column == 3:
+            return height_info['waveform']
+        if column == 4:
+            return "✓" if cls._is_selected(row) else ""
+        end_times = result.get('all_end_times', {})
+        marker = str(height_info['marker'])
+        return str(end_times[marker]['time']) if marker in end_times else ""
+
+    def cell_background(self, row, column):
+        if column == 4 and self._is_selected(row):
+            return SELECTED_BRUSH
+        return None
+
+    @staticmethod
+    def _is_selected(row):
+        result, height_info = row
+        return str(height_info['marker']) == str(result['marker'])
@@ -1,95 +1,123 @@
+import io
+from collections import defaultdict
+
 import openpyxl
 from openpyxl.styles import Font, PatternFill
+from openpyxl.utils import get_column_letter
+
+from logic.log_processor import format_waveform_lines
+from logic.stats import duration_stats
+
+# Column widths are derived from the known cell formats; write-only sheets
+# can't be measured after the fact
+MAX_NAME_COLUMN_WIDTH = 50
+ITERATION_COLUMN_WIDTH = 8
+AVERAGE_COLUMN_WIDTH = 10
+WAVEFORM_COLUMN_WIDTH = 60
 
 class ExcelExporter:
-    def __init__(self):
-        pass
+    def __init__(self, summary_cache=None):
+        # key -> (results, summary). Pass a long-lived dict to reuse summaries across
+        # exports; an entry only counts while it refers to the very same results list.
+        self._waveform_cache = summary_cache if summary_cache is not None else {}
 
     def export_excel_with_highlighting(self, batch_results, filename):
         """Export to Excel with the new format."""
         try:
-            workbook = openpyxl.Workbook()
-            sheet = workbook.active
-            sheet.title = "Batch Results"
-
-            # Find max number of iterations for header
-            max_iterations = 0
-            for results in batch_results.values():
-                if len(results) > max_iterations:
-                    max_iterations = len(results)
-
-            # Create headers
-            headers = ["Test Case Name"]
-            for i in range(1, max_iterations + 1):
-                headers.append(f"IT_{i:02d}")
-            headers.extend(["Average", "Waveform Data"])
-            sheet.append(headers)
-
-            # Write data rows
-            for test_case_name, results in batch_results.items():
-                row_data = [test_case_name]
-                durations = [r['duration'] for r in results]
-
-                # Add iteration durations
-                for i in range(max_iterations):
-                    if i < len(durations):
-                        row_data.append(f"{durations[i]:.3f}")
-                    else:
-                        row_data.append("")
-
-                # Add average
-                avg_duration = sum(durations) / len(durations) if durations else 0
-                row_data.append(f"{avg_duration:.3f}")
-
-                # Add waveform data
-                row_data.append(self.get_waveform_summary(results))
-
-                sheet.append(row_data)
-
-            # Auto-size columns
-            for column in sheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if cell.value:
-                            length = len(str(cell.value))
-                            if length > max_length:
-                                max_length = length
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                sheet.column_dimensions[column_letter].width = adjusted_width
-
-            workbook.save(filename)
+            data = self.generate_excel_bytes(batch_results)
+            with open(filename, 'wb') as f:
+                f.write(data)
             return True, f"Excel file saved to:\n{filename}"
 
         except Exception as e:
             return False, f"Failed to save Excel file: {str(e)}"
 
-    def get_waveform_summary(self, results):
-        """Get a summary of waveform data for a set of results."""
+    def generate_excel_bytes(self, batch_results):
+        """Build the batch results workbook and return it as .xlsx bytes."""
+        # Write-only mode streams rows out instead of keeping every cell object alive
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet("Batch Results")
+
+        # Find max number of iterations for header
+        max_iterations = 0
+        for results in batch_results.values():
+            if len(results) > max_iterations:
+                max_iterations = len(results)
+
+        # Create headers
+        headers = ["Test Case Name"]
+        for i in range(1, max_iterations + 1):
+            headers.append(f"IT_{i:02d}")
+        headers.extend(["Average", "Waveform Data"])
+
+        # Column widths must be set before the first row is written
+        name_len = max(len(headers[0]), max(map(len, batch_results), default=0))
+        widths = ([min(name_len + 2, MAX_NAME_COLUMN_WIDTH)]
+                  + [ITERATION_COLUMN_WIDTH] * max_iterations
+                  + [AVERAGE_COLUMN_WIDTH, WAVEFORM_COLUMN_WIDTH])
+        for index, width in enumerate(widths, 1):
+            sheet.column_dimensions[get_column_letter(index)].width = width
+
+        sheet.append(headers)
+
+        # Write data rows
+        for test_case_name, results in batch_results.items():
+            row_data = [test_case_name]
+            avg_duration, _, _, durations = duration_stats(results)
+
+            # Add iteration durations
+            row_data.extend(f"{duration:.3f}" for duration in durations.tolist())
+            row_data.extend([""] * (max_iterations - len(durations)))
+
+            # Add average
+            row_data.append(f"{avg_duration:.3f}")
+
+            # Add waveform data
+            row_data.append(self.get_waveform_summary(results, test_case_name))
+
+            sheet.append(row_data)
+
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        return buffer.getvalue()
+
+    def get_waveform_summary(self, results, key=None):
+        """Get a summary of waveform data for a set of results.
+
+        key identifies the results in the summary cache; it defaults to id(results).
+        """
         if not results:
             return ""
 
-        patterns = {}
-        for result in results:
-            waveform_data = []
-            for idx, height_info in enumerate(result['all_heights'], 1):
-                height = height_info['height']
-                waveform = height_info['waveform']
-                waveform_data.append(f"{idx}. Height - {height}, Waveform - {waveform}")
+        if key is None:
+            key = id(results)
+        cached = self._waveform_cache.get(key)
+        if cached is not None and cached[0] is results:
+            return cached[1]
 
-            pattern_key = "\n".join(waveform_data)
-            if pattern_key not in patterns:
-                patterns[pattern_key] = []
-            patterns[pattern_key].append(f"IT_{result['iteration']:02d}")
+        # Group by (height, waveform) tuples; text is only formatted once per distinct pattern
+        patterns = defaultdict(list)
+        for result in results:
+            patterns[self._waveform_pattern(result)].append(result)
 
         summary = []
-        for pattern, iterations in patterns.items():
-            if len(iterations) == len(results):
+        for matching in patterns.values():
+            pattern = format_waveform_lines(matching[0])
+            if len(matching) == len(results):
                 summary.append("Same pattern for all iterations:\n" + pattern)
             else:
-                summary.append(f"Pattern for {', '.join(iterations)}:\n" + pattern)
-
-        return "\n\n".join(summary)
+                iterations = ", ".join(f"IT_{result['iteration']:02d}" for result in matching)
+                summary.append(f"Pattern for {iterations}:\n" + pattern)
+
+        summary = "\n\n".join(summary)
+        self._waveform_cache[key] = (results, summary)
+        return summary
+
+    @staticmethod
+    def _waveform_pattern(result):
+        """Hashable (height, waveform) sequence for a result"""
+        heights = result.get('heights')
+        waveforms = result.get('waveforms')
+        if heights is None or waveforms is None:
+            return tuple((h['height'], h['waveform']) for h in result['all_heights'])
+        return tuple(zip(heights, waveforms))
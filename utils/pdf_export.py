@@ -3,11 +3,10 @@
 PDF Export Module for Kindle Log Analyzer
 Generates comprehensive PDF reports with highlighted start/stop points
 """
+import io
 import zipfile
 import re
-import os
 from datetime import datetime
-from pathlib import Path
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -15,6 +14,7 @@ from reportlab.lib.colors import yellow, black, white, blue, red, green
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
 
+from logic.log_processor import report_base_names
 from utils.txt_export import TxtExporter
 
 
@@ -95,44 +95,54 @@ class PdfExporter:
     def generate_pdf_report(self, results, output_path, mode="default"):
         """Generate comprehensive PDF report with highlighting"""
         try:
-            # Create PDF document
-            doc = SimpleDocTemplate(
-                output_path,
-                pagesize=A4,
-                rightMargin=50,
-                leftMargin=50,
-                topMargin=50,
-                bottomMargin=50
-            )
-            
-            story = []
-            
-            # Add title
-            title = f"Kindle Log Analysis Report - {mode.title()} Mode"
-            story.append(Paragraph(title, self.title_style))
-            story.append(Spacer(1, 20))
-            
-            # Add generation timestamp
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            story.append(Paragraph(f"Generated on: {timestamp}", self.styles['Normal']))
-            story.append(Spacer(1, 20))
-            
-            # Generate table of contents with durations and averages
-            story.extend(self.create_table_of_contents(results))
-            story.append(PageBreak())
-            
-            # Process each iteration
-            for idx, result in enumerate(results):
-                story.extend(self.process_iteration_for_pdf(result))
-                if idx < len(results) - 1:  # Add page break between iterations
-                    story.append(PageBreak())
-            
-            # Build PDF
-            doc.build(story)
+            self.build_pdf(results, output_path, mode)
             return True, f"PDF report generated successfully at {output_path}"
             
         except Exception as e:
             return False, f"Error generating PDF: {str(e)}"
+
+    def generate_pdf_bytes(self, results, mode="default"):
+        """Generate the PDF report in memory and return its bytes"""
+        buffer = io.BytesIO()
+        self.build_pdf(results, buffer, mode)
+        return buffer.getvalue()
+
+    def build_pdf(self, results, target, mode="default"):
+        """Build the PDF report into target, a file path or binary file object"""
+        # Create PDF document
+        doc = SimpleDocTemplate(
+            target,
+            pagesize=A4,
+            rightMargin=50,
+            leftMargin=50,
+            topMargin=50,
+            bottomMargin=50
+        )
+        
+        story = []
+        
+        # Add title
+        title = f"Kindle Log Analysis Report - {mode.title()} Mode"
+        story.append(Paragraph(title, self.title_style))
+        story.append(Spacer(1, 20))
+        
+        # Add generation timestamp
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        story.append(Paragraph(f"Generated on: {timestamp}", self.styles['Normal']))
+        story.append(Spacer(1, 20))
+        
+        # Generate table of contents with durations and averages
+        story.extend(self.create_table_of_contents(results))
+        story.append(PageBreak())
+        
+        # Process each iteration
+        for idx, result in enumerate(results):
+            story.extend(self.process_iteration_for_pdf(result))
+            if idx < len(results) - 1:  # Add page break between iterations
+                story.append(PageBreak())
+        
+        # Build PDF
+        doc.build(story)
     
     def export_pdf_report(self, results, output_path, current_mode):
         """Export a single PDF report."""
@@ -146,21 +156,14 @@ class PdfExporter:
         """Export all reports into a single ZIP file."""
         try:
             txt_exporter = TxtExporter()
-            with zipfile.ZipFile(zip_path, 'w') as zipf:
+            # Reports are generated in memory and written straight into the archive
+            with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED) as zipf:
+                base_names = report_base_names(batch_results)
                 for filename, results in batch_results.items():
-                    base_name = Path(filename).stem
-
-                    # Generate and add PDF report
-                    pdf_path = f"{base_name}_report.pdf"
-                    self.generate_pdf_report(results, pdf_path, current_mode)
-                    zipf.write(pdf_path, os.path.basename(pdf_path))
-                    os.remove(pdf_path)
+                    base_name = base_names[filename]
 
-                    # Generate and add TXT report
-                    txt_path = f"{base_name}_report.txt"
-                    txt_exporter.export_txt_file(results, txt_path)
-                    zipf.write(txt_path, os.path.basename(txt_path))
-                    os.remove(txt_path)
+                    zipf.writestr(f"{base_name}_report.pdf", self.generate_pdf_bytes(results, current_mode))
+                    zipf.writestr(f"{base_name}_report.txt", txt_exporter.generate_txt_bytes(results))
 
             return True, f"Reports successfully exported to {zip_path}"
 
@@ -2,202 +2,586 @@
 TXT Export Module for Kindle Log Analyzer
 Exports iteration logs in original input format
 """
+import errno
+import gzip
+import io
+import mmap
+import multiprocessing
 import os
 import re
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+# Output buffer for export files, well above the 8 KiB default
+WRITE_BUFFER_SIZE = 1 << 20
+
+# gzip level for compressed exports; higher levels cost far more time for little gain
+GZIP_COMPRESS_LEVEL = 1
+
+# Exports smaller than this are joined and written in a single call
+SMALL_WRITE_LIMIT = 1 << 20
+
+# Exports at least this large bypass the page cache with O_DIRECT where supported
+DIRECT_WRITE_THRESHOLD = 4 << 20
+DIRECT_WRITE_ALIGNMENT = 4096
+
+# Most buffers a single writev() call accepts
+try:
+    IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = -1
+if IOV_MAX <= 0:
+    IOV_MAX = 1024
+
+# One summary detail row per iteration, filled by a single % call
+_SUMMARY_ROW_FORMAT = ("  ITERATION_%s: Start=%s, Stop=%s, Duration=%s, "
+                       "Waveform=%s, Height=%s, Marker=%s\n")
+
+
+def _writev_all(fd, buffers):
+    """Write every buffer to fd with os.writev, resuming after partial writes"""
+    buffers = list(buffers)
+    index = 0
+    while index < len(buffers):
+        written = os.writev(fd, buffers[index:index + IOV_MAX])
+        # Skip the buffers the kernel took in full; trim the one it stopped in
+        while index < len(buffers) and written >= len(buffers[index]):
+            written -= len(buffers[index])
+            index += 1
+        if written:
+            buffers[index] = memoryview(buffers[index])[written:]
+
+
+def _emit_iteration(parts, header, original_log, placeholder, is_last, separator):
+    """Append one iteration block: header, log body (or placeholder), then separator.
+
+    A missing final newline on the body is folded into the fragment after it;
+    the separator is left off the last iteration.
+    """
+    parts.append(header)
+    body = original_log or placeholder
+    parts.append(body)
+    nl = '' if body[-1:] == '\n' else '\n'
+    if not is_last:
+        parts.append(nl + separator)
+    elif nl:
+        parts.append(nl)
+
+
+class ExportError(Exception):
+    """An export file could not be produced; the underlying error is chained as __cause__"""
+
+    def __init__(self, path, action="Error exporting"):
+        # Both fields go in args so the error survives pickling out of a pool worker
+        super().__init__(path, action)
+        self.path = path
+        self.action = action
+
+    def __reduce__(self):
+        # Pickling drops __cause__ by default; carry it along so pool results keep it
+        return type(self), self.args, {'__cause__': self.__cause__}
+
+    def __setstate__(self, state):
+        self.__cause__ = state['__cause__']
+
+    def __str__(self):
+        # Built only when someone actually reads the message
+        if self.__cause__ is None:
+            return f"{self.action} {self.path}"
+        return f"{self.action} {self.path}: {self.__cause__}"
+
 
 class TxtExporter:
     """TXT export functionality maintaining original log format"""
     
+    SEPARATOR = "=" * 80
+    ITERATION_SEPARATOR = "-" * 40
+    # Previous per-instance names, kept for callers that read them
+    separator = SEPARATOR
+    iteration_separator = ITERATION_SEPARATOR
+    
     def __init__(self):
-        self.separator = "=" * 80
-        self.iteration_separator = "-" * 40
+        # Formatted on first use; every file written by this exporter shares it
+        self._generated_on = None
+
+    def generated_on(self):
+        """Generation timestamp shared by all exports made with this instance"""
+        if self._generated_on is None:
+            self._generated_on = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        return self._generated_on
     
-    def export_txt_file(self, results, output_path, include_summary=True):
-        """Export results to TXT file maintaining original format"""
+    def export_txt_file(self, results, output_path, include_summary=True, _opener=open, compress=False):
+        """Export results to TXT file maintaining original format; raises ExportError on failure.
+
+        With compress the export is gzipped on the fly into output_path + '.gz'.
+        """
+        if compress:
+            output_path = os.fspath(output_path) + '.gz'
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                # Write header
-                f.write("KINDLE LOG ANALYZER - EXPORTED LOGS\n")
-                f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(self.separator + "\n\n")
-                
-                # Write summary if requested
-                if include_summary and results:
-                    f.write("SUMMARY\n")
-                    f.write(self.iteration_separator + "\n")
-                    f.write(f"Total Iterations: {len(results)}\n")
-                    
-                    durations = [r.get('duration', 0) for r in results if r.get('duration') is not None]
-                    if durations:
-                        f.write(f"Average Duration: {sum(durations) / len(durations):.2f}\n")
-                        f.write(f"Min Duration: {min(durations)}\n")
-                        f.write(f"Max Duration: {max(durations)}\n")
-                    
-                    f.write("\nIteration Details:\n")
-                    for result in results:
-                        f.write(f"  ITERATION_{result.get('iteration', 'N/A')}: "
-                                f"Start={result.get('start', 'N/A')}, "
-                                f"Stop={result.get('stop', 'N/A')}, "
-                                f"Duration={result.get('duration', 'N/A')}, "
-                                f"Waveform={result.get('max_height_waveform', 'N/A')}, "
-                                f"Height={result.get('max_height', 'N/A')}, "
-                                f"Marker={result.get('marker', 'N/A')}\n")
-                    
-                    f.write("\n" + self.separator + "\n\n")
-                
-                # Write each iteration's original log content
-                for idx, result in enumerate(results):
-                    iteration_num = result.get('iteration', f'{idx+1:02d}')
-                    f.write(f"ITERATION_{iteration_num}\n")
-                    f.write(self.iteration_separator + "\n")
-                    
-                    # Write original log content exactly as it was
-                    original_log = result.get('original_log', '')
-                    if original_log:
-                        # Ensure we maintain exact formatting
-                        f.write(original_log)
-                        if not original_log.endswith('\n'):
-                            f.write('\n')
-                    else:
-                        f.write("No original log content available for this iteration.\n")
-                    
-                    # Add separator between iterations
-                    if idx < len(results) - 1:
-                        f.write("\n" + self.separator + "\n\n")
-                
-                f.write("\n" + self.separator + "\n")
-                f.write("END OF LOG EXPORT\n")
-            
-            return True, f"TXT file exported successfully to {output_path}"
-            
+            if compress:
+                # Chunks are compressed as they are rendered, so the export is never held whole
+                with _opener(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as raw, \
+                        gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=GZIP_COMPRESS_LEVEL) as f:
+                    f.writelines(self.iter_export_chunks(results, include_summary))
+            else:
+                self._write_parts(output_path, list(self.iter_export_chunks(results, include_summary)), _opener)
         except Exception as e:
-            return False, f"Error exporting TXT file: {str(e)}"
+            raise ExportError(output_path, "Error exporting TXT file") from e
     
-    def export_raw_logs_only(self, results, output_path):
-        """Export only the raw log content without any additional formatting"""
+    def export_many(self, jobs, include_summary=True, workers=None):
+        """Export several result sets, one TXT file each, in parallel worker processes.
+
+        jobs is a list of (results, output_path) pairs. Returns one entry per job,
+        in job order: None on success or the ExportError raised for that file.
+        A job whose output_path repeats an earlier job's is not written.
+        Rendering is CPU-bound Python, so files go to separate processes; a single
+        job is exported in-process rather than paying for pool start-up.
+        """
+        # Fix the timestamp before the exporter is pickled so every file shares it
+        self.generated_on()
+        
+        # Two workers writing one file would lose a report, so repeats fail up front
+        outcomes = [None] * len(jobs)
+        pending = []
+        seen = set()
+        for index, (results, output_path) in enumerate(jobs):
+            key = os.path.normcase(os.path.abspath(output_path))
+            if key in seen:
+                outcomes[index] = ExportError(output_path, "Duplicate output path")
+            else:
+                seen.add(key)
+                pending.append((index, results, output_path))
+        
+        if len(pending) <= 1:
+            for index, results, output_path in pending:
+                outcomes[index] = self._export_one(results, output_path, include_summary)
+            return outcomes
+        
+        workers = min(workers or os.cpu_count() or 1, len(pending))
+        # Spawn rather than fork: callers may have threads running, and a forked
+        # child can inherit a lock another thread held mid-operation
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = [(index, executor.submit(self._export_one, results, output_path, include_summary))
+                       for index, results, output_path in pending]
+            for index, future in futures:
+                outcomes[index] = future.result()
+        return outcomes
+
+    def _export_one(self, results, output_path, include_summary):
+        """export_txt_file for a batch job: the ExportError is returned, not raised"""
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                for idx, result in enumerate(results):
-                    iteration_num = result.get('iteration', f'{idx+1:02d}')
-                    
-                    # Write iteration header exactly as it would appear in original logs
-                    f.write(f"ITERATION_{iteration_num}\n")
-                    
-                    # Write original log content exactly as it was
-                    original_log = result.get('original_log', '')
-                    if original_log:
-                        f.write(original_log)
-                        if not original_log.endswith('\n'):
-                            f.write('\n')
-                    
-                    # Add blank line between iterations (if not last)
-                    if idx < len(results) - 1:
-                        f.write('\n')
+            self.export_txt_file(results, output_path, include_summary)
+        except ExportError as e:
+            return e
+        return None
+
+    @classmethod
+    def _write_parts(cls, output_path, parts, opener=open):
+        """Write a list of UTF-8 encoded parts in binary mode, skipping the text I/O layer.
+
+        Small exports are joined and written in one Path.write_bytes call. Larger
+        ones are never joined into one payload: they are copied straight into the
+        O_DIRECT buffer or go out with os.writev.
+        opener stands in for open(); tests pass one returning an in-memory sink.
+        """
+        if opener is open:
+            size = sum(map(len, parts))
+            if size < SMALL_WRITE_LIMIT:
+                # Callers may already hold a Path; don't pay to build another
+                path = output_path if isinstance(output_path, Path) else Path(output_path)
+                path.write_bytes(b"".join(parts))
+                return
+            if size >= DIRECT_WRITE_THRESHOLD and hasattr(os, 'O_DIRECT'):
+                if cls._export_direct(output_path, parts, size):
+                    return
+            if hasattr(os, 'writev'):
+                fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+                try:
+                    _writev_all(fd, parts)
+                finally:
+                    os.close(fd)
+                return
+        with opener(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.writelines(parts)
+
+    @staticmethod
+    def _export_direct(output_path, parts, size):
+        """Write parts with O_DIRECT so a large export doesn't flood the page cache.
+
+        The data goes out from a page-aligned buffer padded to the block size and
+        the file is then truncated to the real length. Returns False, leaving the
+        caller to write normally, if the filesystem refuses O_DIRECT.
+        """
+        padded = -(-size // DIRECT_WRITE_ALIGNMENT) * DIRECT_WRITE_ALIGNMENT
+        try:
+            fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o666)
+        except OSError as e:
+            if e.errno == errno.EINVAL:
+                return False
+            raise
+        try:
+            # Anonymous mappings are page aligned, as O_DIRECT requires
+            with mmap.mmap(-1, padded) as buffer:
+                for part in parts:
+                    buffer.write(part)
+                view = memoryview(buffer)
+                try:
+                    written = 0
+                    while written < padded:
+                        written += os.write(fd, view[written:])
+                finally:
+                    view.release()
+            os.ftruncate(fd, size)
+        except OSError as e:
+            if e.errno == errno.EINVAL:
+                return False
+            raise
+        finally:
+            os.close(fd)
+        return True
+
+    def generate_txt_bytes(self, results, include_summary=True):
+        """Render the TXT export in memory and return it UTF-8 encoded, as a bytearray.
+
+        Chunks are encoded one at a time and appended, so the whole export never
+        exists as a str alongside its encoded copy.
+        """
+        out = bytearray()
+        for chunk in self.iter_export_chunks(results, include_summary):
+            out += chunk
+        return out
+
+    def iter_export_chunks(self, results, include_summary=True):
+        """Yield the TXT export as UTF-8 encoded chunks.
+
+        The first chunk is the header and summary, then one chunk per iteration,
+        then the footer. Each chunk is encoded only when requested, so callers can
+        stream the export without holding all of it in memory.
+        """
+        for block in self._render_blocks(results, include_summary):
+            yield "".join(block).encode('utf-8')
+
+    def _render_blocks(self, results, include_summary=True):
+        """Build the TXT export as lists of string fragments, one list per output chunk.
+
+        Fragments reference the original log strings, so this costs little beyond
+        the headers and summary rows.
+        """
+        separator = self.SEPARATOR
+        iteration_separator = self.ITERATION_SEPARATOR
+        summarize = include_summary and results
+        
+        # One pass over results fills both the summary rows and the iteration blocks
+        summary_parts = []
+        iteration_blocks = []
+        # Running duration aggregates, so no list of durations is built
+        d_sum = 0
+        d_count = 0
+        d_min = d_max = None
+        last_idx = len(results) - 1
+        between = f"\n{separator}\n\n"
+        for idx, result in enumerate(results):
+            get = result.get
             
-            return True, f"Raw logs exported successfully to {output_path}"
+            if summarize:
+                duration = get('duration')
+                if duration is not None:
+                    d_sum += duration
+                    d_count += 1
+                    if d_min is None or duration < d_min:
+                        d_min = duration
+                    if d_max is None or duration > d_max:
+                        d_max = duration
+                summary_parts.append(_SUMMARY_ROW_FORMAT % (
+                    get('iteration', 'N/A'), get('start', 'N/A'), get('stop', 'N/A'),
+                    get('duration', 'N/A'), get('max_height_waveform', 'N/A'),
+                    get('max_height', 'N/A'), get('marker', 'N/A')))
             
-        except Exception as e:
-            return False, f"Error exporting raw logs: {str(e)}"
-    
-    def create_comparison_file(self, original_content, results, output_path):
-        """Create a comparison file showing original vs processed content"""
+            block = []
+            _emit_iteration(block,
+                            f"ITERATION_{get('iteration', f'{idx+1:02d}')}\n{iteration_separator}\n",
+                            get('original_log', ''),
+                            "No original log content available for this iteration.\n",
+                            idx == last_idx, between)
+            iteration_blocks.append(block)
+        
+        # Header
+        head = ["KINDLE LOG ANALYZER - EXPORTED LOGS\n"
+                f"Generated on: {self.generated_on()}\n"
+                f"{separator}\n\n"]
+        
+        # Summary if requested
+        if summarize:
+            head.append(f"SUMMARY\n{iteration_separator}\nTotal Iterations: {len(results)}\n")
+            if d_count:
+                head.append(f"Average Duration: {d_sum / d_count:.2f}\n"
+                            f"Min Duration: {d_min}\n"
+                            f"Max Duration: {d_max}\n")
+            head.append("\nIteration Details:\n")
+            head.extend(summary_parts)
+            head.append(f"\n{separator}\n\n")
+        
+        return [head, *iteration_blocks, [f"\n{separator}\nEND OF LOG EXPORT\n"]]
+
+    def export_raw_logs_only(self, results, output_path, _opener=open):
+        """Export only the raw log content without any additional formatting; raises ExportError on failure"""
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write("KINDLE LOG ANALYZER - ORIGINAL vs PROCESSED COMPARISON\n")
-                f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(self.separator + "\n\n")
-                
-                f.write("ORIGINAL CONTENT:\n")
-                f.write(self.iteration_separator + "\n")
-                f.write(original_content)
-                f.write("\n\n" + self.separator + "\n\n")
-                
-                f.write("PROCESSED ITERATIONS:\n")
-                f.write(self.iteration_separator + "\n")
+            # Parts are encoded as they are produced. A log object shared by several
+            # iterations is encoded once and its bytes reused, keyed by id(); the
+            # results keep every log alive, so ids can't be recycled mid-export.
+            parts = []
+            encoded_logs = {}
+            last_idx = len(results) - 1
+            for idx, result in enumerate(results):
+                get = result.get
                 
-                for idx, result in enumerate(results):
-                    iteration_num = result.get('iteration', f'{idx+1:02d}')
-                    f.write(f"\nITERATION_{iteration_num} - PROCESSED RESULTS:\n")
-                    f.write(f"  Start: {result.get('start', 'N/A')}\n")
-                    f.write(f"  Stop: {result.get('stop', 'N/A')}\n")
-                    f.write(f"  Duration: {result.get('duration', 'N/A')}\n")
-                    f.write(f"  Max Height: {result.get('max_height', 'N/A')}\n")
-                    f.write(f"  Waveform: {result.get('max_height_waveform', 'N/A')}\n")
-                    
-                    f.write(f"\nORIGINAL LOG FOR ITERATION_{iteration_num}:\n")
-                    original_log = result.get('original_log', '')
-                    if original_log:
-                        f.write(original_log)
-                        if not original_log.endswith('\n'):
-                            f.write('\n')
-                    else:
-                        f.write("No original log content available.\n")
-                    
-                    if idx < len(results) - 1:
-                        f.write("\n" + self.iteration_separator + "\n")
+                # Iteration header exactly as it would appear in original logs
+                parts.append(f"ITERATION_{get('iteration', f'{idx+1:02d}')}\n".encode('utf-8'))
                 
-                f.write("\n" + self.separator + "\n")
-                f.write("END OF COMPARISON\n")
+                # Original log content exactly as it was
+                original_log = get('original_log') or ''
+                encoded = encoded_logs.get(id(original_log))
+                if encoded is None:
+                    # Empty logs need no newline; the blank line between iterations is added unless last
+                    nl = b'' if original_log[-1:] in ('\n', '') else b'\n'
+                    encoded = encoded_logs[id(original_log)] = (original_log.encode('utf-8'), nl)
+                log_bytes, nl = encoded
+                parts.append(log_bytes)
+                if idx < last_idx:
+                    nl += b'\n'
+                if nl:
+                    parts.append(nl)
+            
+            self._write_parts(output_path, parts, _opener)
+        except Exception as e:
+            raise ExportError(output_path, "Error exporting raw logs") from e
+    
+    def create_comparison_file(self, original_content, results, output_path, _opener=open):
+        """Create a comparison file showing original vs processed content; raises ExportError on failure"""
+        try:
+            parts = ["KINDLE LOG ANALYZER - ORIGINAL vs PROCESSED COMPARISON\n"
+                     f"Generated on: {self.generated_on()}\n"
+                     f"{self.SEPARATOR}\n\n"
+                     f"ORIGINAL CONTENT:\n{self.ITERATION_SEPARATOR}\n",
+                     original_content,
+                     f"\n\n{self.SEPARATOR}\n\n"
+                     f"PROCESSED ITERATIONS:\n{self.ITERATION_SEPARATOR}\n"]
+            
+            last_idx = len(results) - 1
+            between = f"\n{self.ITERATION_SEPARATOR}\n"
+            for idx, result in enumerate(results):
+                get = result.get
+                iteration_num = get('iteration', f'{idx+1:02d}')
+                _emit_iteration(parts,
+                                f"\nITERATION_{iteration_num} - PROCESSED RESULTS:\n"
+                                f"  Start: {get('start', 'N/A')}\n"
+                                f"  Stop: {get('stop', 'N/A')}\n"
+                                f"  Duration: {get('duration', 'N/A')}\n"
+                                f"  Max Height: {get('max_height', 'N/A')}\n"
+                                f"  Waveform: {get('max_height_waveform', 'N/A')}\n"
+                                f"\nORIGINAL LOG FOR ITERATION_{iteration_num}:\n",
+                                get('original_log', ''),
+                                "No original log content available.\n",
+                                idx == last_idx, between)
             
-            return True, f"Comparison file created successfully at {output_path}"
+            parts.append(f"\n{self.SEPARATOR}\nEND OF COMPARISON\n")
             
+            self._write_parts(output_path, [part.encode('utf-8') for part in parts], _opener)
         except Exception as e:
-            return False, f"Error creating comparison file: {str(e)}"
+            raise ExportError(output_path, "Error creating comparison file") from e
 
     def export_txt_report(self, results, filename):
         """Export a single TXT report."""
         try:
             self.export_txt_file(results, filename)
             return True, f"Report successfully exported to {filename}"
-        except Exception as e:
-            return False, f"Failed to create TXT file: {e}"
+        except ExportError as e:
+            return False, f"Failed to create TXT file: {e.__cause__}"
 
 
-def test_txt_export():
-    """Test function for TXT export"""
-    # Sample test data
-    test_results = [
-        {
-            'iteration': '01',
-            'start': 650205,
-            'stop': 651234,
-            'duration': 1029,
-            'marker': '123',
-            'max_height': 1200,
-            'max_height_waveform': 'DU',
-            'original_log': '''1751099650.205215 def:pbpress:time=650.205:Power button pressed
+# Sample data for the tests below
+_TEST_RESULTS = [
+    {
+        'iteration': '01',
+        'start': 650205,
+        'stop': 651234,
+        'duration': 1029,
+        'marker': '123',
+        'max_height': 1200,
+        'max_height_waveform': 'DU',
+        'original_log': '''1751099650.205215 def:pbpress:time=650.205:Power button pressed
 1751099651.234567 Some log line with marker [123] and height=1200
 1751099651.234567 update end marker=123 end time=1751099651234567'''
-        },
-        {
-            'iteration': '02',
-            'start': 652345,
-            'stop': 653456,
-            'duration': 1111,
-            'marker': '124',
-            'max_height': 800,
-            'max_height_waveform': 'GC16',
-            'original_log': '''1751099652.345678 def:pbpress:time=652.345:Power button pressed
+    },
+    {
+        'iteration': '02',
+        'start': 652345,
+        'stop': 653456,
+        'duration': 1111,
+        'marker': '124',
+        'max_height': 800,
+        'max_height_waveform': 'GC16',
+        'original_log': '''1751099652.345678 def:pbpress:time=652.345:Power button pressed
 1751099653.456789 Another log line with different data
 1751099653.456789 update end marker=124 end time=1751099653456789'''
-        }
-    ]
+    }
+]
+
+
+class _MemorySink(io.BytesIO):
+    """In-memory stand-in for an export file; keeps its bytes in written[path] on close"""
+
+    def __init__(self, written, path):
+        super().__init__()
+        self._written = written
+        self._path = path
+
+    def close(self):
+        if not self.closed:
+            self._written[self._path] = self.getvalue()
+        super().close()
+
+
+def test_txt_export():
+    """Test function for TXT export"""
+    test_results = _TEST_RESULTS
+    
+    exporter = TxtExporter()
+    expected_txt = bytes(exporter.generate_txt_bytes(test_results))
+    expected_raw = "".join([
+        "ITERATION_01\n", test_results[0]['original_log'], "\n\n",
+        "ITERATION_02\n", test_results[1]['original_log'], "\n",
+    ]).encode('utf-8')
+    
+    # Formatting cost alone: every write lands in an in-memory buffer
+    written = {}
+    memory_opener = lambda path, *args, **kwargs: _MemorySink(written, path)
+    start = time.perf_counter()
+    exporter.export_txt_file(test_results, "export", _opener=memory_opener)
+    exporter.export_raw_logs_only(test_results, "raw", _opener=memory_opener)
+    print(f"In-memory export: {(time.perf_counter() - start) * 1000:.3f} ms")
+    assert written["export"] == expected_txt, "in-memory TXT export differs from generate_txt_bytes"
+    assert written["raw"] == expected_raw, "in-memory raw export differs from the original logs"
+    
+    # Real files in a scratch directory, on a RAM disk when one is available
+    scratch_root = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    with tempfile.TemporaryDirectory(dir=scratch_root) as output_dir:
+        export_path = Path(output_dir, "test_export.txt")
+        raw_path = Path(output_dir, "test_raw.txt")
+        start = time.perf_counter()
+        exporter.export_txt_file(test_results, export_path)
+        exporter.export_raw_logs_only(test_results, raw_path)
+        print(f"File export: {(time.perf_counter() - start) * 1000:.3f} ms")
+        
+        assert export_path.read_bytes() == expected_txt, "TXT export file differs from generate_txt_bytes"
+        assert raw_path.read_bytes() == expected_raw, "raw export file differs from the original logs"
     
+    print("TXT Export Test: passed")
+    return True
+
+
+def _scaled_results(min_bytes):
+    """Repeat the sample results, renumbered, until their logs total min_bytes"""
+    results = []
+    size = 0
+    while size < min_bytes:
+        for sample in _TEST_RESULTS:
+            result = dict(sample, iteration=f"{len(results) + 1:02d}")
+            results.append(result)
+            size += len(result['original_log'])
+    return results
+
+
+def test_writev_export():
+    """Test the os.writev path, including resuming after short writes"""
+    # Between SMALL_WRITE_LIMIT and DIRECT_WRITE_THRESHOLD, in more parts than IOV_MAX
+    results = _scaled_results(1 << 20)
     exporter = TxtExporter()
+    expected = bytes(exporter.generate_txt_bytes(results))
+    assert SMALL_WRITE_LIMIT <= len(expected) < DIRECT_WRITE_THRESHOLD, len(expected)
+    
+    real_writev = os.writev
+    calls = []
     
-    # Test regular export
-    success1, message1 = exporter.export_txt_file(test_results, "/home/ubuntu/test_export.txt")
-    print(f"TXT Export Test: {message1}")
+    def short_writev(fd, buffers):
+        # Take at most an odd number of bytes per call, so writes stop mid-buffer
+        calls.append(len(buffers))
+        room = 65537
+        taken = []
+        for buffer in buffers:
+            if room <= 0:
+                break
+            taken.append(memoryview(buffer)[:room])
+            room -= len(taken[-1])
+        return real_writev(fd, taken)
     
-    # Test raw logs only export
-    success2, message2 = exporter.export_raw_logs_only(test_results, "/home/ubuntu/test_raw.txt")
-    print(f"Raw Export Test: {message2}")
+    with tempfile.TemporaryDirectory() as output_dir:
+        export_path = Path(output_dir, "test_writev.txt")
+        os.writev = short_writev
+        try:
+            exporter.export_txt_file(results, export_path)
+        finally:
+            os.writev = real_writev
+        
+        assert len(calls) > len(expected) // 65537, "export did not go through os.writev"
+        assert max(calls) <= IOV_MAX, "a writev call was passed more than IOV_MAX buffers"
+        assert export_path.read_bytes() == expected, "writev export differs from generate_txt_bytes"
+    
+    print("Writev Export Test: passed")
+    return True
+
+
+
+def test_direct_export():
+    """Test the O_DIRECT path for large exports and its fallback when O_DIRECT is refused"""
+    if not hasattr(os, 'O_DIRECT'):
+        print("Direct Export Test: skipped, no O_DIRECT on this platform")
+        return True
+    
+    results = _scaled_results(DIRECT_WRITE_THRESHOLD)
+    exporter = TxtExporter()
+    expected = bytes(exporter.generate_txt_bytes(results))
+    # Not a multiple of the block size, so the padding has to be truncated away
+    assert len(expected) >= DIRECT_WRITE_THRESHOLD and len(expected) % DIRECT_WRITE_ALIGNMENT, len(expected)
+    parts = list(exporter.iter_export_chunks(results))
+    
+    # The default temp dir rather than /dev/shm: tmpfs refuses O_DIRECT
+    with tempfile.TemporaryDirectory() as output_dir:
+        direct_path = Path(output_dir, "test_direct.txt")
+        if TxtExporter._export_direct(direct_path, parts, len(expected)):
+            assert direct_path.stat().st_size == len(expected), "O_DIRECT export left padding behind"
+            assert direct_path.read_bytes() == expected, "O_DIRECT export differs from generate_txt_bytes"
+            print("Direct Export Test: passed")
+        else:
+            print("Direct Export Test: skipped, O_DIRECT refused by this filesystem")
+        
+        # Refuse O_DIRECT the way tmpfs does; the export must fall back to a normal write
+        real_open = os.open
+        
+        def refusing_open(path, flags, *args, **kwargs):
+            if flags & os.O_DIRECT:
+                raise OSError(errno.EINVAL, os.strerror(errno.EINVAL), path)
+            return real_open(path, flags, *args, **kwargs)
+        
+        fallback_path = Path(output_dir, "test_fallback.txt")
+        os.open = refusing_open
+        try:
+            assert not TxtExporter._export_direct(fallback_path, parts, len(expected))
+            exporter.export_txt_file(results, fallback_path)
+        finally:
+            os.open = real_open
+        assert fallback_path.stat().st_size == len(expected), "fallback export has the wrong length"
+        assert fallback_path.read_bytes() == expected, "fallback export differs from generate_txt_bytes"
     
-    return success1 and success2
+    print("Direct Export Fallback Test: passed")
+    return True
 
 
 if __name__ == "__main__":
     test_txt_export()
+    test_writev_export()
+    test_direct_export()